@@ -0,0 +1,9 @@
+"""Shared fixtures for contract tests."""
+
+import pytest
+
+
+@pytest.fixture
+def unknown_id() -> str:
+    """Well-formed UUID that never matches a stored record."""
+    return "11111111-1111-4111-8111-111111111111"
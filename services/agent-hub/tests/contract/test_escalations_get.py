@@ -3,8 +3,6 @@
 Tests the get escalation API contract per contracts/agent-hub.yaml.
 """
 
-from uuid import uuid4
-
 import pytest
 from httpx import AsyncClient
 
@@ -33,14 +31,13 @@ class TestGetEscalation:
     async def test_get_escalation_not_found(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test escalation retrieval with non-existent ID.
 
         Contract: Non-existent escalation returns 404 with ErrorResponse.
         """
-        non_existent_id = str(uuid4())
-
-        response = await test_client.get(f"/escalations/{non_existent_id}")
+        response = await test_client.get(f"/escalations/{unknown_id}")
 
         assert response.status_code == 404
         data = response.json()
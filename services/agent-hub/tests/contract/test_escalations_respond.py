@@ -3,8 +3,6 @@
 Tests the submit human response API contract per contracts/agent-hub.yaml.
 """
 
-from uuid import uuid4
-
 import pytest
 from httpx import AsyncClient
 
@@ -51,15 +49,14 @@ class TestSubmitHumanResponse:
     async def test_submit_response_not_found(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test submitting response to non-existent escalation.
 
         Contract: Non-existent escalation returns 404.
         """
-        non_existent_id = str(uuid4())
-
         response = await test_client.post(
-            f"/escalations/{non_existent_id}",
+            f"/escalations/{unknown_id}",
             json={
                 "action": "confirm",
                 "responder": "@testuser",
@@ -76,15 +73,14 @@ class TestSubmitHumanResponse:
     async def test_submit_response_invalid_action(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test submitting response with invalid action.
 
         Contract: Invalid action returns 400/422.
         """
-        escalation_id = str(uuid4())
-
         response = await test_client.post(
-            f"/escalations/{escalation_id}",
+            f"/escalations/{unknown_id}",
             json={
                 "action": "invalid_action",
                 "responder": "@testuser",
@@ -96,15 +92,14 @@ class TestSubmitHumanResponse:
     async def test_submit_correct_requires_response(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test that CORRECT action requires response field.
 
         Contract: CORRECT action requires 'response' field.
         """
-        escalation_id = str(uuid4())
-
         response = await test_client.post(
-            f"/escalations/{escalation_id}",
+            f"/escalations/{unknown_id}",
             json={
                 "action": "correct",
                 "responder": "@testuser",
@@ -118,15 +113,14 @@ class TestSubmitHumanResponse:
     async def test_submit_response_missing_responder(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test submitting response without responder.
 
         Contract: responder is required.
         """
-        escalation_id = str(uuid4())
-
         response = await test_client.post(
-            f"/escalations/{escalation_id}",
+            f"/escalations/{unknown_id}",
             json={
                 "action": "confirm",
                 # Missing 'responder' field
@@ -3,8 +3,6 @@
 Tests the close session API contract per contracts/agent-hub.yaml.
 """
 
-from uuid import uuid4
-
 import pytest
 from httpx import AsyncClient
 
@@ -42,14 +40,13 @@ class TestCloseSession:
     async def test_close_session_not_found(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test session closure with non-existent ID.
 
         Contract: Non-existent session returns 404 with ErrorResponse.
         """
-        non_existent_id = str(uuid4())
-
-        response = await test_client.delete(f"/sessions/{non_existent_id}")
+        response = await test_client.delete(f"/sessions/{unknown_id}")
 
         assert response.status_code == 404
         data = response.json()
@@ -3,8 +3,6 @@
 Tests the get session API contract per contracts/agent-hub.yaml.
 """
 
-from uuid import uuid4
-
 import pytest
 from httpx import AsyncClient
 
@@ -46,14 +44,13 @@ class TestGetSession:
     async def test_get_session_not_found(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test session retrieval with non-existent ID.
 
         Contract: Non-existent session returns 404 with ErrorResponse.
         """
-        non_existent_id = str(uuid4())
-
-        response = await test_client.get(f"/sessions/{non_existent_id}")
+        response = await test_client.get(f"/sessions/{unknown_id}")
 
         assert response.status_code == 404
         data = response.json()
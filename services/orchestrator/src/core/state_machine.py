@@ -67,6 +67,14 @@ VALID_TRANSITIONS: dict[str, dict[str, list[str]]] = {
     WorkflowStatus.FAILED.value: {},
 }
 
+# Flattened (from_status, trigger, to_status) triples for O(1) validity checks
+_ALLOWED_TRANSITIONS: frozenset[tuple[str, str, str]] = frozenset(
+    (from_status, trigger, to_status)
+    for from_status, triggers in VALID_TRANSITIONS.items()
+    for trigger, targets in triggers.items()
+    for to_status in targets
+)
+
 
 class WorkflowStateMachine:
     """Manages workflow state transitions."""
@@ -199,6 +207,9 @@ class WorkflowStateMachine:
         if not self._is_valid_transition(from_status, to_status, trigger):
             raise InvalidStateTransitionError(from_status, to_status, trigger)
 
+        # One timestamp per transition keeps history, updated_at and completed_at equal
+        now = datetime.utcnow()
+
         # Record history
         history = WorkflowHistory(
             id=str(uuid4()),
@@ -206,13 +217,14 @@ class WorkflowStateMachine:
             from_status=from_status,
             to_status=to_status,
             trigger=trigger,
+            created_at=now,
         )
         history.set_metadata(phase_result)
         self.db.add(history)
 
         # Update workflow
         workflow.status = to_status
-        workflow.updated_at = datetime.utcnow()
+        workflow.updated_at = now
 
         # Update phase if moving to next phase
         if (
@@ -223,7 +235,7 @@ class WorkflowStateMachine:
 
         # Mark completed
         if to_status == WorkflowStatus.COMPLETED.value:
-            workflow.completed_at = datetime.utcnow()
+            workflow.completed_at = now
             if phase_result:
                 workflow.set_result(phase_result)
 
@@ -247,9 +259,7 @@ class WorkflowStateMachine:
         Returns:
             True if transition is valid
         """
-        transitions = VALID_TRANSITIONS.get(from_status, {})
-        allowed_targets = transitions.get(trigger, [])
-        return to_status in allowed_targets
+        return (from_status, trigger, to_status) in _ALLOWED_TRANSITIONS
 
     def _determine_next_status(
         self,
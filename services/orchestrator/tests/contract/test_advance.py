@@ -4,7 +4,6 @@ Tests the advance workflow API contract per contracts/orchestrator.yaml.
 """
 
 from typing import Any
-from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
@@ -57,15 +56,14 @@ class TestAdvanceWorkflow:
     async def test_advance_workflow_not_found(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test workflow advancement with non-existent ID.
 
         Contract: Non-existent workflow returns 404 with ErrorResponse.
         """
-        non_existent_id = str(uuid4())
-
         response = await test_client.post(
-            f"/workflows/{non_existent_id}/advance",
+            f"/workflows/{unknown_id}/advance",
             json={"trigger": "agent_complete"},
         )
 
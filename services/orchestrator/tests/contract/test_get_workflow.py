@@ -4,7 +4,6 @@ Tests the get workflow API contract per contracts/orchestrator.yaml.
 """
 
 from typing import Any
-from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
@@ -48,14 +47,13 @@ class TestGetWorkflow:
     async def test_get_workflow_not_found(
         self,
         test_client: AsyncClient,
+        unknown_id: str,
     ) -> None:
         """Test workflow retrieval with non-existent ID.
 
         Contract: Non-existent workflow returns 404 with ErrorResponse.
         """
-        non_existent_id = str(uuid4())
-
-        response = await test_client.get(f"/workflows/{non_existent_id}")
+        response = await test_client.get(f"/workflows/{unknown_id}")
 
         assert response.status_code == 404
         data = response.json()
@@ -173,7 +173,16 @@ class TestWorkflowStateMachine:
         # Get workflow - if history is exposed, verify it exists
         response = await test_client.get(f"/workflows/{workflow_id}")
         assert response.status_code == 200
-        # History verification would require additional endpoint or field
+
+        from src.db.models import Workflow, WorkflowHistory
+        from src.db.session import SessionLocal
+
+        with SessionLocal() as db:
+            workflow = db.get(Workflow, workflow_id)
+            history = db.query(WorkflowHistory).filter_by(workflow_id=workflow_id).all()
+        assert len(history) == 3
+        # The last transition stamps its history row and the workflow together
+        assert max(entry.created_at for entry in history) == workflow.updated_at
 
     async def test_workflow_cannot_transition_from_completed(
         self,
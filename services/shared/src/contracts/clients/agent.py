@@ -5,6 +5,7 @@ from uuid import UUID
 
 import httpx
 
+from contracts.clients.headers import JSON_HEADERS
 from contracts.models.agent import (
     ErrorResponse,
     HealthResponse,
@@ -102,17 +103,18 @@ class AgentClient:
         try:
             response = await self.client.post(
                 "/invoke",
-                json=request.model_dump(mode="json"),
+                content=request.model_dump_json(),
+                headers=JSON_HEADERS,
             )
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return InvokeResponse.model_validate(response.json())
+            return InvokeResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentClientError(f"Request failed: {e}") from e
@@ -135,7 +137,7 @@ class AgentClient:
                     status_code=response.status_code,
                 )
 
-            return HealthResponse.model_validate(response.json())
+            return HealthResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentClientError(f"Health check failed: {e}") from e
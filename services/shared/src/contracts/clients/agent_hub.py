@@ -5,6 +5,7 @@ from uuid import UUID
 
 import httpx
 
+from contracts.clients.headers import JSON_HEADERS
 from contracts.models.agent import ErrorResponse, InvokeRequest, InvokeResponse
 from contracts.models.escalation import (
     AskExpertRequest,
@@ -111,17 +112,18 @@ class AgentHubClient:
         try:
             response = await self.client.post(
                 f"/invoke/{agent}",
-                json=request.model_dump(mode="json"),
+                content=request.model_dump_json(),
+                headers=JSON_HEADERS,
             )
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentHubClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return InvokeResponse.model_validate(response.json())
+            return InvokeResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentHubClientError(f"Request failed: {e}") from e
@@ -161,17 +163,18 @@ class AgentHubClient:
         try:
             response = await self.client.post(
                 f"/ask/{topic}",
-                json=request.model_dump(mode="json"),
+                content=request.model_dump_json(),
+                headers=JSON_HEADERS,
             )
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentHubClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return AskExpertResponse.model_validate(response.json())
+            return AskExpertResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentHubClientError(f"Request failed: {e}") from e
@@ -203,17 +206,18 @@ class AgentHubClient:
         try:
             response = await self.client.post(
                 "/sessions",
-                json=request.model_dump(mode="json"),
+                content=request.model_dump_json(),
+                headers=JSON_HEADERS,
             )
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentHubClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return SessionResponse.model_validate(response.json())
+            return SessionResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentHubClientError(f"Request failed: {e}") from e
@@ -237,13 +241,13 @@ class AgentHubClient:
             response = await self.client.get(f"/sessions/{session_id}")
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentHubClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return SessionWithMessagesResponse.model_validate(response.json())
+            return SessionWithMessagesResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentHubClientError(f"Request failed: {e}") from e
@@ -267,13 +271,13 @@ class AgentHubClient:
             response = await self.client.delete(f"/sessions/{session_id}")
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentHubClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return SessionResponse.model_validate(response.json())
+            return SessionResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentHubClientError(f"Request failed: {e}") from e
@@ -299,13 +303,13 @@ class AgentHubClient:
             response = await self.client.get(f"/escalations/{escalation_id}")
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentHubClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return EscalationResponse.model_validate(response.json())
+            return EscalationResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentHubClientError(f"Request failed: {e}") from e
@@ -340,17 +344,18 @@ class AgentHubClient:
         try:
             response = await self.client.post(
                 f"/escalations/{escalation_id}",
-                json=request.model_dump(mode="json"),
+                content=request.model_dump_json(),
+                headers=JSON_HEADERS,
             )
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise AgentHubClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return EscalationResponse.model_validate(response.json())
+            return EscalationResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise AgentHubClientError(f"Request failed: {e}") from e
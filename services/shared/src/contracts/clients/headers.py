@@ -0,0 +1,4 @@
+"""HTTP headers shared by the service clients."""
+
+# Only requests that send a JSON body carry a Content-Type
+JSON_HEADERS = {"Content-Type": "application/json"}
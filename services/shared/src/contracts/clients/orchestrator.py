@@ -5,6 +5,7 @@ from uuid import UUID
 
 import httpx
 
+from contracts.clients.headers import JSON_HEADERS
 from contracts.models.agent import ErrorResponse
 from contracts.models.workflow import (
     AdvanceWorkflowRequest,
@@ -97,17 +98,18 @@ class OrchestratorClient:
         try:
             response = await self.client.post(
                 "/workflows",
-                json=request.model_dump(mode="json"),
+                content=request.model_dump_json(),
+                headers=JSON_HEADERS,
             )
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise OrchestratorClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return WorkflowResponse.model_validate(response.json())
+            return WorkflowResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise OrchestratorClientError(f"Request failed: {e}") from e
@@ -131,13 +133,13 @@ class OrchestratorClient:
             response = await self.client.get(f"/workflows/{workflow_id}")
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise OrchestratorClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return WorkflowResponse.model_validate(response.json())
+            return WorkflowResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise OrchestratorClientError(f"Request failed: {e}") from e
@@ -169,17 +171,18 @@ class OrchestratorClient:
         try:
             response = await self.client.post(
                 f"/workflows/{workflow_id}/advance",
-                json=request.model_dump(mode="json"),
+                content=request.model_dump_json(),
+                headers=JSON_HEADERS,
             )
 
             if response.status_code >= 400:
-                error = ErrorResponse.model_validate(response.json())
+                error = ErrorResponse.model_validate_json(response.content)
                 raise OrchestratorClientError(
                     f"{error.error.code}: {error.error.message}",
                     status_code=response.status_code,
                 )
 
-            return WorkflowResponse.model_validate(response.json())
+            return WorkflowResponse.model_validate_json(response.content)
 
         except httpx.RequestError as e:
             raise OrchestratorClientError(f"Request failed: {e}") from e
@@ -66,12 +66,16 @@ class GitHubAppAuth:
         self.installation_id = installation_id
         self.private_key_path = Path(private_key_path)
 
-        # Validate PEM file exists
-        if not self.private_key_path.exists():
-            raise FileNotFoundError(f"GitHub App private key not found: {self.private_key_path}")
+        # Validate PEM file exists (a single stat serves the permission check too)
+        try:
+            key_stat = self.private_key_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"GitHub App private key not found: {self.private_key_path}"
+            ) from None
 
         # Validate PEM file permissions (must be 600)
-        if self.private_key_path.stat().st_mode & 0o777 != 0o600:
+        if key_stat.st_mode & 0o777 != 0o600:
             raise PermissionError(
                 f"GitHub App private key must have permissions 600: {self.private_key_path}"
             )
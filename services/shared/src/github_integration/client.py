@@ -5,6 +5,9 @@ Lightweight wrapper around requests library for GitHub API calls with retry logi
 and rate limit detection.
 """
 
+import copy
+import logging
+import threading
 import time
 from typing import Any
 
@@ -20,15 +23,19 @@ class GitHubAPIClient:
     GitHub API client with retry logic and rate limit handling.
 
     Features:
-    - Fixed retry: 3 attempts with 1-second delay
+    - Fixed retry: 3 attempts with 1-second delay (or server Retry-After)
     - Rate limit detection and error reporting
     - Structured logging for all requests
     - Installation token authentication
+    - Persistent HTTP session (keep-alive connection reuse)
+    - Conditional GETs (ETag / If-None-Match) for unchanged resources
     """
 
     BASE_URL = "https://api.github.com"
     MAX_RETRIES = 3
     RETRY_DELAY = 1  # seconds
+    MAX_RETRY_AFTER = 60  # seconds, cap on server-requested Retry-After delays
+    ETAG_CACHE_SIZE = 128  # cached GET responses
 
     def __init__(self, auth: GitHubAppAuth, repository: str) -> None:
         """
@@ -41,6 +48,26 @@ class GitHubAPIClient:
         self.auth = auth
         self.repository = repository
         self.owner, self.repo = repository.split("/")
+        # One pooled session so consecutive calls reuse the TLS connection.
+        # Worker threads may share it: each call passes its own headers and
+        # urllib3's pool is thread-safe. Call close() once they have finished.
+        self._session = requests.Session()
+        # GET URL (with query) -> (ETag, decoded body), oldest entries evicted first.
+        # The client is shared across threads, so all cache access holds the lock.
+        self._etag_cache: dict[str, tuple[str, Any]] = {}
+        self._etag_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and its connections."""
+        self._session.close()
+
+    def __enter__(self) -> "GitHubAPIClient":
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit context, closing the HTTP session."""
+        self.close()
 
     def _get_headers(self) -> dict[str, str]:
         """Get HTTP headers with authentication token"""
@@ -55,6 +82,9 @@ class GitHubAPIClient:
         """
         Check if response indicates rate limit exceeded.
 
+        Covers 429 and 403 responses carrying Retry-After or an exhausted
+        X-RateLimit-Remaining (GitHub's secondary rate limits).
+
         Args:
             response: HTTP response from GitHub API
 
@@ -83,6 +113,64 @@ class GitHubAPIClient:
                 wait_seconds=wait_seconds,
             )
 
+        if response.status_code == 403:
+            # 403 is a rate limit only when GitHub says so via headers;
+            # otherwise it is a permission error left to raise_for_status()
+            retry_after = self._retry_after(response)
+            if retry_after is not None:
+                wait_seconds = retry_after
+            elif response.headers.get("X-RateLimit-Remaining") == "0":
+                reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
+                wait_seconds = max(reset_time - int(time.time()), 60)
+            else:
+                return
+
+            logger.error(
+                "GitHub rate limit exceeded",
+                extra={
+                    "context": {
+                        "status_code": 403,
+                        "wait_seconds": wait_seconds,
+                    }
+                },
+            )
+
+            raise RateLimitExceeded(
+                f"GitHub rate limit exceeded. Wait {wait_seconds} seconds",
+                wait_seconds=wait_seconds,
+            )
+
+    def _retry_after(self, response: requests.Response) -> int | None:
+        """
+        Parse a numeric Retry-After header, capped at MAX_RETRY_AFTER.
+
+        Args:
+            response: HTTP response from GitHub API
+
+        Returns:
+            Seconds the server asked to wait, or None if the header is absent
+        """
+        retry_after = str(response.headers.get("Retry-After", ""))
+        if retry_after.isdigit():
+            return min(int(retry_after), self.MAX_RETRY_AFTER)
+        return None
+
+    def _retry_delay(self, response: requests.Response) -> float:
+        """
+        Get delay before retrying a 5xx response.
+
+        Honors a numeric Retry-After header (capped at MAX_RETRY_AFTER),
+        otherwise falls back to the fixed RETRY_DELAY.
+
+        Args:
+            response: HTTP response from GitHub API
+
+        Returns:
+            Seconds to wait before the next attempt
+        """
+        retry_after = self._retry_after(response)
+        return self.RETRY_DELAY if retry_after is None else retry_after
+
     def _request(
         self,
         method: str,
@@ -110,20 +198,35 @@ class GitHubAPIClient:
         url = f"{self.BASE_URL}{path}"
         headers = self._get_headers()
 
+        # Revalidate cached GETs; a 304 reply is free against the rate limit
+        cache_key = None
+        cached = None
+        if method == "GET":
+            # The prepared URL encodes params the same way the request will,
+            # including list values, and is always hashable
+            cache_key = requests.Request("GET", url, params=params).prepare().url
+            with self._etag_lock:
+                cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers["If-None-Match"] = cached[0]
+
         for attempt in range(1, self.MAX_RETRIES + 1):
             try:
-                logger.info(
-                    f"GitHub API request: {method} {path}",
-                    extra={
-                        "context": {
-                            "method": method,
-                            "path": path,
-                            "attempt": attempt,
-                        }
-                    },
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "GitHub API request: %s %s",
+                        method,
+                        path,
+                        extra={
+                            "context": {
+                                "method": method,
+                                "path": path,
+                                "attempt": attempt,
+                            }
+                        },
+                    )
 
-                response = requests.request(
+                response = self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -135,6 +238,11 @@ class GitHubAPIClient:
                 # Check rate limit first
                 self._check_rate_limit(response)
 
+                # Not modified since the cached response
+                if response.status_code == 304 and cached is not None:
+                    # Copy so callers cannot mutate the cached body
+                    return copy.deepcopy(cached[1])
+
                 # Handle 404 - resource not found
                 if response.status_code == 404:
                     logger.error(
@@ -158,7 +266,9 @@ class GitHubAPIClient:
                 # Handle 5xx - server error (retry)
                 if 500 <= response.status_code < 600:
                     logger.warning(
-                        f"GitHub server error (attempt {attempt}/{self.MAX_RETRIES})",
+                        "GitHub server error (attempt %d/%d)",
+                        attempt,
+                        self.MAX_RETRIES,
                         extra={
                             "context": {
                                 "method": method,
@@ -169,7 +279,7 @@ class GitHubAPIClient:
                         },
                     )
                     if attempt < self.MAX_RETRIES:
-                        time.sleep(self.RETRY_DELAY)
+                        time.sleep(self._retry_delay(response))
                         continue
                     else:
                         raise ServerError(
@@ -181,11 +291,17 @@ class GitHubAPIClient:
                 response.raise_for_status()
 
                 # Success - return JSON data
-                return response.json() if response.text else {}
+                data = response.json() if response.text else {}
+                if cache_key is not None:
+                    self._store_etag(cache_key, response.headers.get("ETag"), data)
+                return data
 
             except (requests.ConnectionError, requests.Timeout) as e:
                 logger.warning(
-                    f"Network error (attempt {attempt}/{self.MAX_RETRIES}): {e}",
+                    "Network error (attempt %d/%d): %s",
+                    attempt,
+                    self.MAX_RETRIES,
+                    e,
                     extra={
                         "context": {
                             "method": method,
@@ -208,7 +324,8 @@ class GitHubAPIClient:
             except requests.HTTPError as e:
                 # Other HTTP errors - don't retry
                 logger.error(
-                    f"GitHub API HTTP error: {e}",
+                    "GitHub API HTTP error: %s",
+                    e,
                     extra={
                         "context": {
                             "method": method,
@@ -226,6 +343,17 @@ class GitHubAPIClient:
         # Should never reach here, but for type safety
         raise ServerError(f"Request failed after {self.MAX_RETRIES} retries")
 
+    def _store_etag(self, cache_key: str, etag: str | None, data: Any) -> None:
+        """Remember a GET response so the next identical GET can be conditional"""
+        with self._etag_lock:
+            if not etag:
+                self._etag_cache.pop(cache_key, None)
+                return
+            if cache_key not in self._etag_cache and len(self._etag_cache) >= self.ETAG_CACHE_SIZE:
+                del self._etag_cache[next(iter(self._etag_cache))]
+            # Own a copy: the caller gets the original and may mutate it
+            self._etag_cache[cache_key] = (etag, copy.deepcopy(data))
+
     # Convenience methods for HTTP verbs
 
     def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
@@ -65,10 +65,11 @@ class ValidationError(GitHubAPIError):
 
 class RateLimitExceeded(GitHubAPIError):
     """
-    GitHub API rate limit exceeded (429).
+    GitHub API rate limit exceeded (429, or 403 with rate limit headers).
 
     Raised when:
     - Rate limit hit (check wait_seconds for reset time)
+    - Secondary rate limit hit (wait_seconds taken from Retry-After)
 
     Attributes:
         wait_seconds: Number of seconds to wait before retry
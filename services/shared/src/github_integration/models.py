@@ -10,11 +10,13 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+_MENTION_RE = re.compile(r"@(\w+)")
+
 
 class Issue(BaseModel):
     """Represents a GitHub issue"""
 
-    model_config = ConfigDict(frozen=True)  # Immutable
+    model_config = ConfigDict(frozen=True, defer_build=True)  # Immutable, built on first use
 
     number: int = Field(..., description="Issue number (unique within repo)", gt=0)
     title: str = Field(..., description="Issue title", min_length=1, max_length=256)
@@ -35,7 +37,7 @@ class Issue(BaseModel):
 class Comment(BaseModel):
     """Represents a GitHub issue comment"""
 
-    model_config = ConfigDict(frozen=True)  # Immutable
+    model_config = ConfigDict(frozen=True, defer_build=True)  # Immutable, built on first use
 
     id: int = Field(..., description="Comment ID (unique globally)", gt=0)
     issue_number: int = Field(..., description="Parent issue number", gt=0)
@@ -50,13 +52,13 @@ class Comment(BaseModel):
 
     def extract_mentions(self) -> list[str]:
         """Extract @mentions from comment body"""
-        return re.findall(r"@(\w+)", self.body)
+        return _MENTION_RE.findall(self.body)
 
 
 class Label(BaseModel):
     """Represents a GitHub label"""
 
-    model_config = ConfigDict(frozen=True)  # Immutable
+    model_config = ConfigDict(frozen=True, defer_build=True)  # Immutable, built on first use
 
     name: str = Field(..., description="Label name", min_length=1, max_length=50)
     color: str = Field(..., description="Hex color code (without #)", pattern="^[0-9A-Fa-f]{6}$")
@@ -71,7 +73,7 @@ class Label(BaseModel):
 class PullRequest(BaseModel):
     """Represents a GitHub pull request"""
 
-    model_config = ConfigDict(frozen=True)  # Immutable
+    model_config = ConfigDict(frozen=True, defer_build=True)  # Immutable, built on first use
 
     number: int = Field(..., description="PR number (unique within repo)", gt=0)
     title: str = Field(..., description="PR title", min_length=1, max_length=256)
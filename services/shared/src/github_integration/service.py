@@ -24,6 +24,10 @@ from .models import (
     PullRequest,
 )
 
+_LINKED_ISSUE_RE = re.compile(r"(?:closes|fixes|resolves)\s+#(\d+)", re.IGNORECASE)
+_LIST_STATES = frozenset({"open", "closed", "all"})
+_UPDATE_STATES = frozenset({"open", "closed"})
+
 
 class GitHubService:
     """
@@ -83,6 +87,18 @@ class GitHubService:
             },
         )
 
+    def close(self) -> None:
+        """Close the API client's HTTP session."""
+        self.client.close()
+
+    def __enter__(self) -> "GitHubService":
+        """Enter context."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit context, closing the HTTP session."""
+        self.close()
+
     def create_issue(
         self,
         title: str,
@@ -218,7 +234,7 @@ class GitHubService:
             ServerError: If GitHub API returns 5xx after retries
         """
         # Validate state
-        if state not in ["open", "closed", "all"]:
+        if state not in _LIST_STATES:
             raise ValueError(f"Invalid state: {state}. Must be 'open', 'closed', or 'all'")
 
         # Prepare API request
@@ -309,7 +325,7 @@ class GitHubService:
             raise ValueError(f"Issue number must be positive: {issue_number}")
 
         # Validate state if provided
-        if state is not None and state not in ["open", "closed"]:
+        if state is not None and state not in _UPDATE_STATES:
             raise ValueError(f"Invalid state: {state}. Must be 'open' or 'closed'")
 
         # Validate title if provided
@@ -832,7 +848,7 @@ class GitHubService:
             ServerError: If GitHub API returns 5xx after retries
         """
         # Validate state
-        if state not in ["open", "closed", "all"]:
+        if state not in _LIST_STATES:
             raise ValueError(f"Invalid state: {state}. Must be 'open', 'closed', or 'all'")
 
         # Make API call
@@ -871,12 +887,8 @@ class GitHubService:
             PullRequest: Parsed pull request model
         """
         # Extract linked issues from body (e.g., "Closes #42")
-        linked_issues: list[int] = []
         body = data.get("body") or ""
-        import re
-
-        matches = re.findall(r"(?:closes|fixes|resolves)\s+#(\d+)", body, re.IGNORECASE)
-        linked_issues = [int(m) for m in matches]
+        linked_issues = [int(m) for m in _LINKED_ISSUE_RE.findall(body)]
 
         return PullRequest(
             number=data["number"],
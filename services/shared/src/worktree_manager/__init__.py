@@ -25,6 +25,7 @@ from .errors import (
     WorktreeError,
     WorktreeExistsError,
     WorktreeNotFoundError,
+    WorktreeNotPopulatedError,
 )
 from .models import (
     Branch,
@@ -64,6 +65,7 @@ __all__: list[str] = [
     "BranchNotFoundError",
     "WorktreeExistsError",
     "WorktreeNotFoundError",
+    "WorktreeNotPopulatedError",
     "UncommittedChangesError",
     "PushError",
 ]
@@ -140,6 +140,21 @@ class WorktreeNotFoundError(WorktreeError):
         self.issue_number = issue_number
 
 
+class WorktreeNotPopulatedError(WorktreeError):
+    """
+    Worktree has no tracked files on disk.
+
+    Raised when:
+    - Committing from a worktree created with checkout=False
+    - Worktree files must be checked out first
+    """
+
+    def __init__(self, issue_number: int) -> None:
+        message = f"Worktree for issue #{issue_number} is not checked out"
+        super().__init__(message, error_code="WORKTREE_NOT_POPULATED")
+        self.issue_number = issue_number
+
+
 class UncommittedChangesError(WorktreeError):
     """
     Worktree has uncommitted changes.
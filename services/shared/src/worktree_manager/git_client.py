@@ -5,7 +5,9 @@ Low-level wrapper around git commands using subprocess.
 Provides type-safe interface for git operations.
 """
 
+import logging
 import subprocess
+import time
 from pathlib import Path
 
 from .errors import GitCommandError, GitNotFoundError, NotARepositoryError
@@ -20,6 +22,8 @@ class GitClient:
     All methods operate on a specific repository path.
     """
 
+    REMOTE_REFS_TTL = 30.0  # seconds
+
     def __init__(self, repo_path: str | Path) -> None:
         """
         Initialize GitClient for a repository.
@@ -33,6 +37,9 @@ class GitClient:
         """
         self.repo_path = Path(repo_path).resolve()
 
+        # Cached (loaded_at, branch names) from `git ls-remote --heads origin`
+        self._remote_refs: tuple[float, frozenset[str]] | None = None
+
         # T012: Check git availability
         self._check_git_available()
 
@@ -54,8 +61,8 @@ class GitClient:
         try:
             result = subprocess.run(
                 ["git", "--version"],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
             )
             if result.returncode != 0:
@@ -74,8 +81,8 @@ class GitClient:
             result = subprocess.run(
                 ["git", "rev-parse", "--git-dir"],
                 cwd=self.repo_path,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False,
             )
             if result.returncode != 0:
@@ -111,15 +118,16 @@ class GitClient:
         command = ["git"] + args
         working_dir = cwd or self.repo_path
 
-        logger.info(
-            "Running git command",
-            extra={
-                "context": {
-                    "command": command,
-                    "cwd": str(working_dir),
-                }
-            },
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Running git command",
+                extra={
+                    "context": {
+                        "command": command,
+                        "cwd": str(working_dir),
+                    }
+                },
+            )
 
         try:
             result = subprocess.run(
@@ -132,6 +140,10 @@ class GitClient:
         except FileNotFoundError as e:
             raise GitNotFoundError("Git is not installed or not in PATH") from e
 
+        # A push may create or delete remote branches
+        if args and args[0] == "push":
+            self._remote_refs = None
+
         if check and result.returncode != 0:
             raise GitCommandError(
                 command=args,
@@ -141,6 +153,47 @@ class GitClient:
 
         return result
 
+    def _run_small(self, args: list[str]) -> subprocess.CompletedProcess[bytes]:
+        """
+        Run a git command whose output is known to be small.
+
+        Unlike run_command(), stderr is discarded and stdout is returned as raw
+        bytes, so only a single pipe is read and no text decoding is done.
+        Callers needing git's error message should fall back to run_command().
+
+        Args:
+            args: Git command arguments (without 'git' prefix)
+
+        Returns:
+            CompletedProcess with raw stdout bytes
+
+        Raises:
+            GitNotFoundError: If git is not installed or not in PATH
+        """
+        command = ["git"] + args
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Running git command",
+                extra={
+                    "context": {
+                        "command": command,
+                        "cwd": str(self.repo_path),
+                    }
+                },
+            )
+
+        try:
+            return subprocess.run(
+                command,
+                cwd=self.repo_path,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+        except FileNotFoundError as e:
+            raise GitNotFoundError("Git is not installed or not in PATH") from e
+
     def get_current_branch(self) -> str:
         """
         Get the current branch name.
@@ -151,8 +204,12 @@ class GitClient:
         Raises:
             GitCommandError: If not on a branch (detached HEAD)
         """
-        result = self.run_command(["rev-parse", "--abbrev-ref", "HEAD"])
-        return result.stdout.strip()
+        args = ["rev-parse", "--abbrev-ref", "HEAD"]
+        result = self._run_small(args)
+        if result.returncode != 0:
+            # Re-run with stderr captured so the raised error explains the failure
+            return self.run_command(args).stdout.strip()
+        return result.stdout.decode().strip()
 
     def branch_exists(self, branch_name: str, remote: bool = False) -> bool:
         """
@@ -166,19 +223,55 @@ class GitClient:
             True if branch exists
         """
         if remote:
-            # Check remote branches
-            result = self.run_command(
-                ["ls-remote", "--heads", "origin", branch_name],
-                check=False,
-            )
-            return bool(result.stdout.strip())
+            # Check remote branches. The cached listing only answers hits: a
+            # branch pushed elsewhere since it was loaded must not read as missing
+            cached = self._cached_remote_refs()
+            if cached is not None and branch_name in cached:
+                return True
+            return branch_name in self._load_remote_refs()
         else:
             # Check local branches
-            result = self.run_command(
-                ["show-ref", "--verify", f"refs/heads/{branch_name}"],
-                check=False,
+            local = self._run_small(
+                ["show-ref", "--verify", "--quiet", f"refs/heads/{branch_name}"]
             )
-            return result.returncode == 0
+            return local.returncode == 0
+
+    def _cached_remote_refs(self) -> frozenset[str] | None:
+        """
+        Get the branch names from the last ls-remote if under REMOTE_REFS_TTL old.
+
+        Returns:
+            Cached remote branch names, or None if absent or expired
+        """
+        if self._remote_refs is None:
+            return None
+        loaded_at, refs = self._remote_refs
+        if time.monotonic() - loaded_at >= self.REMOTE_REFS_TTL:
+            return None
+        return refs
+
+    def _load_remote_refs(self) -> frozenset[str]:
+        """
+        Query the branch names on origin and cache them.
+
+        A single `git ls-remote --heads origin` call serves every remote
+        branch hit within REMOTE_REFS_TTL instead of one network round-trip
+        each. Failed calls are not cached, so the next check queries origin again.
+
+        Returns:
+            Remote branch names (empty if origin is unreachable or missing)
+        """
+        result = self.run_command(["ls-remote", "--heads", "origin"], check=False)
+        refs = frozenset(
+            line.split("refs/heads/", 1)[1]
+            for line in result.stdout.splitlines()
+            if "refs/heads/" in line
+        )
+        # Only cache a successful listing; a transient failure must not hide
+        # existing branches for the whole TTL
+        if result.returncode == 0:
+            self._remote_refs = (time.monotonic(), refs)
+        return refs
 
     def get_repo_name(self) -> str:
         """
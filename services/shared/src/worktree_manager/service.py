@@ -4,6 +4,7 @@ WorktreeService - High-level service for git worktree management.
 Provides create, manage, and remove operations for git worktrees.
 """
 
+import os
 import re
 from datetime import UTC, datetime
 from pathlib import Path
@@ -16,6 +17,7 @@ from .errors import (
     UncommittedChangesError,
     WorktreeExistsError,
     WorktreeNotFoundError,
+    WorktreeNotPopulatedError,
 )
 from .git_client import GitClient
 from .logger import logger
@@ -76,13 +78,21 @@ class WorktreeService:
         if not self.git.branch_exists("main"):
             raise MainBranchNotFoundError("Main branch not found. Cannot create feature branches.")
 
-    def create_worktree(self, issue_number: int, feature_name: str) -> Worktree:
+    def create_worktree(
+        self,
+        issue_number: int,
+        feature_name: str,
+        checkout: bool = True,
+    ) -> Worktree:
         """
         Create a new feature branch from main and worktree in sibling directory.
 
         Args:
             issue_number: Issue number for the feature
             feature_name: Short name for the feature (lowercase, hyphens)
+            checkout: Populate the working tree. When False, the worktree is
+                registered with its index at main but no files on disk
+                (is_clean=False) until checkout_worktree() is called.
 
         Returns:
             Worktree model with created worktree info
@@ -116,11 +126,14 @@ class WorktreeService:
         if self.git.branch_exists(branch_name):
             raise BranchExistsError(branch_name)
 
-        # Create branch from main (without checkout - just create the ref)
-        self.git.run_command(["branch", branch_name, "main"])
-
-        # Create worktree with that branch
-        self.git.run_command(["worktree", "add", str(worktree_path), branch_name])
+        # Create branch from main and its worktree in a single git call
+        add_args = ["worktree", "add"]
+        if not checkout:
+            add_args.append("--no-checkout")
+        self.git.run_command([*add_args, "-b", branch_name, str(worktree_path), "main"])
+        if not checkout:
+            # --no-checkout leaves the index empty, which git reads as every file deleted
+            self.git.run_command(["read-tree", "HEAD"], cwd=worktree_path)
 
         logger.info(
             "Worktree created",
@@ -138,7 +151,7 @@ class WorktreeService:
             path=worktree_path,
             main_repo_path=self.repo_path,
             branch_name=branch_name,
-            is_clean=True,
+            is_clean=checkout,
             created_at=datetime.now(UTC),
         )
 
@@ -218,6 +231,27 @@ class WorktreeService:
     # US2: Plans initialization
     # =========================================================================
 
+    def checkout_worktree(self, issue_number: int) -> None:
+        """
+        Populate a worktree created with checkout=False.
+
+        Restores tracked files missing from the working tree; files already
+        on disk are left untouched.
+
+        Args:
+            issue_number: Issue number of worktree
+
+        Raises:
+            WorktreeNotFoundError: If no worktree for issue number
+        """
+        worktree_path = self._find_worktree_path_by_issue(issue_number)
+        if worktree_path is None:
+            raise WorktreeNotFoundError(issue_number)
+
+        missing = self._missing_tracked_files(worktree_path)
+        if missing:
+            self.git.run_command(["checkout", "--", *missing], cwd=worktree_path)
+
     def _find_worktree_path_by_issue(self, issue_number: int) -> Path | None:
         """
         Find the worktree path for an issue number.
@@ -335,14 +369,21 @@ class WorktreeService:
             return None
 
         plans_path = worktree_path / ".plans" / str(issue_number)
-        if not plans_path.exists():
+
+        # Check what exists with one directory read instead of a stat per entry
+        try:
+            with os.scandir(plans_path) as it:
+                entries = {entry.name: entry for entry in it}
+        except FileNotFoundError:
             return None
+        except OSError:
+            # Not a directory or unreadable: report it as present but empty
+            entries = {}
 
-        # Check what exists
-        has_specs = (plans_path / "specs").is_dir()
-        has_plans = (plans_path / "plans").is_dir()
-        has_reviews = (plans_path / "reviews").is_dir()
-        has_readme = (plans_path / "README.md").is_file()
+        has_specs = "specs" in entries and entries["specs"].is_dir()
+        has_plans = "plans" in entries and entries["plans"].is_dir()
+        has_reviews = "reviews" in entries and entries["reviews"].is_dir()
+        has_readme = "README.md" in entries and entries["README.md"].is_file()
 
         return PlansFolder(
             issue_number=issue_number,
@@ -374,6 +415,36 @@ class WorktreeService:
         )
         return bool(result.stdout.strip())
 
+    def _missing_tracked_files(self, worktree_path: Path) -> list[str]:
+        """
+        List tracked files that are absent from the working tree.
+
+        Args:
+            worktree_path: Path to worktree
+
+        Returns:
+            Paths relative to the worktree root
+        """
+        result = self.git.run_command(["ls-files", "--deleted", "-z"], cwd=worktree_path)
+        return [name for name in result.stdout.split("\0") if name]
+
+    def _is_populated(self, worktree_path: Path) -> bool:
+        """
+        Check whether the worktree has any tracked files on disk.
+
+        Args:
+            worktree_path: Path to worktree
+
+        Returns:
+            False if every tracked file is missing (checkout=False worktree)
+        """
+        missing = self._missing_tracked_files(worktree_path)
+        if not missing:
+            return True
+        result = self.git.run_command(["ls-files", "-z"], cwd=worktree_path)
+        tracked = [name for name in result.stdout.split("\0") if name]
+        return len(missing) < len(tracked)
+
     def commit_and_push(
         self,
         issue_number: int,
@@ -393,11 +464,16 @@ class WorktreeService:
 
         Raises:
             WorktreeNotFoundError: If no worktree for issue number
+            WorktreeNotPopulatedError: If the worktree was never checked out
         """
         worktree_path = self._find_worktree_path_by_issue(issue_number)
         if worktree_path is None:
             raise WorktreeNotFoundError(issue_number)
 
+        # Staging an unpopulated worktree would record every tracked file as deleted
+        if not self._is_populated(worktree_path):
+            raise WorktreeNotPopulatedError(issue_number)
+
         logger.info(
             "Committing changes",
             extra={
@@ -0,0 +1,48 @@
+"""Shared fixtures and options for shared-library tests."""
+
+import os
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the opt-in flag for tests that call the real GitHub API."""
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="Run tests marked 'network'",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip network tests at collection time unless explicitly enabled."""
+    if config.getoption("--run-network"):
+        return
+
+    skip_network = pytest.mark.skip(reason="network test: pass --run-network to run")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session")
+def isolated_git_env() -> dict[str, str]:
+    """Environment overrides that stop git reading global and system config.
+
+    Keeps local test repositories independent of the developer's ~/.gitconfig
+    (signing, hooks, default branch) and skips parsing those files on every
+    git call. Repository-local config such as user identity still applies.
+    """
+    return {
+        "GIT_CONFIG_GLOBAL": os.devnull,
+        "GIT_CONFIG_NOSYSTEM": "1",
+        "GIT_TERMINAL_PROMPT": "0",
+    }
+
+
+@pytest.fixture
+def isolated_git_config(monkeypatch: pytest.MonkeyPatch, isolated_git_env: dict[str, str]) -> None:
+    """Apply isolated_git_env to every git process started during the test."""
+    for name, value in isolated_git_env.items():
+        monkeypatch.setenv(name, value)
@@ -10,6 +10,7 @@ from github_integration import ResourceNotFoundError, ValidationError
 
 
 @pytest.mark.contract
+@pytest.mark.network
 class TestUpdateIssue:
     """Contract tests for update_issue method"""
 
@@ -73,23 +74,6 @@ class TestUpdateIssue:
         assert updated.body == "Updated body"
         assert updated.state == "closed"
 
-    def test_update_issue_invalid_state(self, service, auto_cleanup_issue):
-        """
-        Verify ValueError raised for invalid state
-
-        Verify:
-        - Invalid state raises ValueError
-        - Issue is not modified
-        """
-        # Create test issue with automatic cleanup
-        issue = auto_cleanup_issue(title="Test")
-
-        # Try invalid state
-        with pytest.raises(ValueError) as exc_info:
-            service.update_issue(issue.number, state="invalid")
-
-        assert "state" in str(exc_info.value).lower()
-
     def test_update_issue_not_found(self, service):
         """
         Verify ResourceNotFoundError for non-existent issue
@@ -100,24 +84,9 @@ class TestUpdateIssue:
         with pytest.raises(ResourceNotFoundError):
             service.update_issue(999999, title="New title")
 
-    def test_update_issue_empty_title(self, service, auto_cleanup_issue):
-        """
-        Verify ValidationError for empty title
-
-        Verify:
-        - Empty title raises ValidationError
-        """
-        # Create test issue with automatic cleanup
-        issue = auto_cleanup_issue(title="Test")
-
-        # Try empty title
-        with pytest.raises(ValidationError) as exc_info:
-            service.update_issue(issue.number, title="")
-
-        assert "title" in str(exc_info.value).lower()
-
 
 @pytest.mark.contract
+@pytest.mark.network
 class TestCloseIssue:
     """Contract tests for close_issue method"""
 
@@ -168,12 +137,33 @@ class TestCloseIssue:
         with pytest.raises(ResourceNotFoundError):
             service.close_issue(999999)
 
-    def test_close_invalid_issue_number(self, service):
-        """
-        Verify ValueError for negative issue number
+
+@pytest.mark.contract
+class TestIssueUpdateValidation:
+    """Client-side validation for update_issue and close_issue (no network)"""
+
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs", "error", "message"),
+        [
+            ("update_issue", (1,), {"state": "invalid"}, ValueError, "state"),
+            ("update_issue", (1,), {"title": ""}, ValidationError, "title"),
+            ("close_issue", (-1,), {}, ValueError, "issue number"),
+        ],
+        ids=["invalid-state", "empty-title", "negative-issue-number"],
+    )
+    def test_invalid_input_rejected_before_request(
+        self, offline_service, method, args, kwargs, error, message
+    ):
+        """
+        Verify invalid input is rejected client-side
 
         Verify:
+        - Invalid state raises ValueError
+        - Empty title raises ValidationError
         - Negative issue number raises ValueError
+        - Issue is not modified (no request is sent)
         """
-        with pytest.raises(ValueError):
-            service.close_issue(-1)
+        with pytest.raises(error) as exc_info:
+            getattr(offline_service, method)(*args, **kwargs)
+
+        assert message in str(exc_info.value).lower()
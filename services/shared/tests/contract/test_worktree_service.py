@@ -5,50 +5,90 @@ Tests the service interface contracts as defined in contracts/worktree-service.m
 Uses temporary git repositories for isolation.
 """
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from worktree_manager.errors import (
+    BranchNotFoundError,
+    MainBranchNotFoundError,
+    UncommittedChangesError,
+    WorktreeExistsError,
+    WorktreeNotFoundError,
+    WorktreeNotPopulatedError,
+)
+from worktree_manager.models import CommitResult, OperationStatus, PlansFolder, Worktree
+from worktree_manager.service import WorktreeService
 
-@pytest.fixture
-def temp_git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository for testing."""
-    repo_path = tmp_path / "test-repo"
-    repo_path.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
+pytestmark = pytest.mark.usefixtures("isolated_git_config")
+
+
+def run_git(repo_path: Path, *args: str, env: dict[str, str] | None = None) -> None:
+    """Run a git setup command in repo_path, discarding output and failing on error."""
     subprocess.run(
-        ["git", "config", "user.name", "Test User"],
+        ["git", *args],
         cwd=repo_path,
+        env=env,
         check=True,
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
+
+
+@pytest.fixture(scope="session")
+def git_repo_template(
+    tmp_path_factory: pytest.TempPathFactory, isolated_git_env: dict[str, str]
+) -> Path:
+    """Build the initial test repository once per session."""
+    repo_path = tmp_path_factory.mktemp("git-template") / "test-repo"
+    repo_path.mkdir()
+    env = {**os.environ, **isolated_git_env}
+    run_git(repo_path, "init", "--template=", "-b", "main", env=env)
+    # Identity stays in repo config: the service makes its own commits in copies
+    run_git(repo_path, "config", "user.email", "test@test.com", env=env)
+    run_git(repo_path, "config", "user.name", "Test User", env=env)
     # Create initial commit on main branch
     readme = repo_path / "README.md"
     readme.write_text("# Test Repository\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
-    # Ensure we're on main branch
-    subprocess.run(
-        ["git", "branch", "-M", "main"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
+    run_git(repo_path, "add", ".", env=env)
+    run_git(repo_path, "commit", "-m", "Initial commit", env=env)
     return repo_path
 
 
+@pytest.fixture
+def temp_git_repo(tmp_path: Path, git_repo_template: Path) -> Path:
+    """Create a temporary git repository for testing (copy of the session template)."""
+    repo_path = tmp_path / "test-repo"
+    shutil.copytree(git_repo_template, repo_path, symlinks=True)
+    return repo_path
+
+
+@pytest.fixture
+def worktree_service(temp_git_repo: Path) -> WorktreeService:
+    """Create a WorktreeService for the per-test repository copy."""
+    return WorktreeService(temp_git_repo)
+
+
+@pytest.fixture(scope="class")
+def created_worktree(
+    tmp_path_factory: pytest.TempPathFactory,
+    git_repo_template: Path,
+    isolated_git_env: dict[str, str],
+) -> tuple[WorktreeService, Worktree]:
+    """Create worktree 123-add-auth once per class and share it between tests."""
+    repo_path = tmp_path_factory.mktemp("created-worktree") / "test-repo"
+    shutil.copytree(git_repo_template, repo_path, symlinks=True)
+    with pytest.MonkeyPatch.context() as mp:
+        for name, value in isolated_git_env.items():
+            mp.setenv(name, value)
+        service = WorktreeService(repo_path)
+        return service, service.create_worktree(issue_number=123, feature_name="add-auth")
+
+
 # =============================================================================
 # US1: create_worktree() and create_worktree_from_existing() contracts
 # =============================================================================
@@ -62,101 +102,113 @@ class TestCreateWorktreeContract:
     and worktree in sibling directory.
     """
 
-    def test_create_worktree_creates_branch_from_main(self, temp_git_repo: Path) -> None:
+    def test_create_worktree_creates_branch_from_main(
+        self, created_worktree: tuple[WorktreeService, Worktree]
+    ) -> None:
         """create_worktree should create branch from main."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        result = service.create_worktree(issue_number=123, feature_name="add-auth")
+        service, result = created_worktree
+        repo_path = service.repo_path
 
         # Branch should exist
         branch_check = subprocess.run(
             ["git", "show-ref", "--verify", "refs/heads/123-add-auth"],
-            cwd=temp_git_repo,
-            capture_output=True,
+            cwd=repo_path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         assert branch_check.returncode == 0
         assert result.branch_name == "123-add-auth"
 
-    def test_create_worktree_creates_sibling_directory(self, temp_git_repo: Path) -> None:
+    def test_create_worktree_creates_sibling_directory(
+        self, created_worktree: tuple[WorktreeService, Worktree]
+    ) -> None:
         """create_worktree should create worktree in sibling directory."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        result = service.create_worktree(issue_number=123, feature_name="add-auth")
+        service, result = created_worktree
+        repo_path = service.repo_path
 
         # Worktree should be in sibling directory
-        expected_path = temp_git_repo.parent / f"{temp_git_repo.name}-123-add-auth"
+        expected_path = repo_path.parent / f"{repo_path.name}-123-add-auth"
         assert result.path == expected_path
         assert expected_path.exists()
         assert (expected_path / ".git").exists()
 
-    def test_create_worktree_returns_worktree_model(self, temp_git_repo: Path) -> None:
+    def test_create_worktree_returns_worktree_model(
+        self, created_worktree: tuple[WorktreeService, Worktree]
+    ) -> None:
         """create_worktree should return Worktree model with correct data."""
-        from worktree_manager.models import Worktree
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        result = service.create_worktree(issue_number=123, feature_name="add-auth")
+        service, result = created_worktree
+        repo_path = service.repo_path
 
         assert isinstance(result, Worktree)
         assert result.issue_number == 123
         assert result.feature_name == "add-auth"
         assert result.branch_name == "123-add-auth"
-        assert result.main_repo_path == temp_git_repo
+        assert result.main_repo_path == repo_path
         assert result.is_clean is True
 
-    def test_create_worktree_directory_exists_raises_error(self, temp_git_repo: Path) -> None:
-        """create_worktree should raise WorktreeExistsError if directory exists."""
-        from worktree_manager.errors import WorktreeExistsError
-        from worktree_manager.service import WorktreeService
+    def test_create_worktree_without_checkout(
+        self, temp_git_repo: Path, worktree_service: WorktreeService
+    ) -> None:
+        """create_worktree(checkout=False) should create branch and empty worktree."""
+        result = worktree_service.create_worktree(
+            issue_number=123, feature_name="add-auth", checkout=False
+        )
+
+        branch_check = subprocess.run(
+            ["git", "show-ref", "--verify", "refs/heads/123-add-auth"],
+            cwd=temp_git_repo,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        assert branch_check.returncode == 0
+        assert (result.path / ".git").exists()
+        assert not (result.path / "README.md").exists()
+        assert result.is_clean is False
+
+    def test_checkout_worktree_populates_no_checkout_worktree(
+        self, worktree_service: WorktreeService
+    ) -> None:
+        """checkout_worktree should restore the files a no-checkout worktree skipped."""
+        wt = worktree_service.create_worktree(
+            issue_number=123, feature_name="add-auth", checkout=False
+        )
+
+        worktree_service.checkout_worktree(123)
 
+        assert (wt.path / "README.md").read_text() == "# Test Repository\n"
+        assert worktree_service.get_worktree(123).is_clean is True
+
+    def test_create_worktree_directory_exists_raises_error(
+        self, temp_git_repo: Path, worktree_service: WorktreeService
+    ) -> None:
+        """create_worktree should raise WorktreeExistsError if directory exists."""
         # Pre-create the directory
         sibling_path = temp_git_repo.parent / f"{temp_git_repo.name}-123-add-auth"
         sibling_path.mkdir()
-
-        service = WorktreeService(temp_git_repo)
         with pytest.raises(WorktreeExistsError) as exc_info:
-            service.create_worktree(issue_number=123, feature_name="add-auth")
+            worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         assert "123-add-auth" in str(exc_info.value)
 
     def test_create_worktree_main_branch_not_found_raises_error(self, tmp_path: Path) -> None:
         """create_worktree should raise MainBranchNotFoundError if no main."""
-        from worktree_manager.errors import MainBranchNotFoundError
-        from worktree_manager.service import WorktreeService
-
         # Create repo without main branch
         repo_path = tmp_path / "no-main-repo"
         repo_path.mkdir()
-        subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "config", "user.email", "test@test.com"],
-            cwd=repo_path,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "config", "user.name", "Test"],
-            cwd=repo_path,
-            check=True,
-            capture_output=True,
-        )
-        # Create commit on a different branch
+        # Create commit on a different branch (NOT main)
+        run_git(repo_path, "init", "--template=", "-b", "develop")
         readme = repo_path / "README.md"
         readme.write_text("# Test\n")
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial"],
-            cwd=repo_path,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "branch", "-M", "develop"],  # NOT main
-            cwd=repo_path,
-            check=True,
-            capture_output=True,
+        run_git(repo_path, "add", ".")
+        run_git(
+            repo_path,
+            "-c",
+            "user.email=test@test.com",
+            "-c",
+            "user.name=Test",
+            "commit",
+            "-m",
+            "Initial",
         )
 
         service = WorktreeService(repo_path)
@@ -171,37 +223,20 @@ class TestCreateWorktreeFromExistingContract:
     Contract: Given existing remote branch, creates worktree checking out that branch.
     """
 
-    def test_create_worktree_from_existing_checks_out_branch(self, temp_git_repo: Path) -> None:
+    def test_create_worktree_from_existing_checks_out_branch(
+        self, temp_git_repo: Path, worktree_service: WorktreeService
+    ) -> None:
         """create_worktree_from_existing should checkout existing branch."""
-        from worktree_manager.service import WorktreeService
-
         # Create a branch that would "exist remotely"
-        subprocess.run(
-            ["git", "checkout", "-b", "123-add-auth"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-        )
+        run_git(temp_git_repo, "checkout", "-b", "123-add-auth")
         # Add a commit to this branch
         test_file = temp_git_repo / "feature.txt"
         test_file.write_text("feature content\n")
-        subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Feature commit"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-        )
+        run_git(temp_git_repo, "add", ".")
+        run_git(temp_git_repo, "commit", "-m", "Feature commit")
         # Go back to main
-        subprocess.run(
-            ["git", "checkout", "main"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-        )
-
-        service = WorktreeService(temp_git_repo)
-        result = service.create_worktree_from_existing(
+        run_git(temp_git_repo, "checkout", "main")
+        result = worktree_service.create_worktree_from_existing(
             issue_number=123, feature_name="add-auth", branch_name="123-add-auth"
         )
 
@@ -212,27 +247,14 @@ class TestCreateWorktreeFromExistingContract:
         # Should have the feature file from that branch
         assert (expected_path / "feature.txt").exists()
 
-    def test_create_worktree_from_existing_returns_worktree(self, temp_git_repo: Path) -> None:
+    def test_create_worktree_from_existing_returns_worktree(
+        self, temp_git_repo: Path, worktree_service: WorktreeService
+    ) -> None:
         """create_worktree_from_existing should return Worktree model."""
-        from worktree_manager.models import Worktree
-        from worktree_manager.service import WorktreeService
-
         # Create existing branch
-        subprocess.run(
-            ["git", "checkout", "-b", "456-fix-bug"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "checkout", "main"],
-            cwd=temp_git_repo,
-            check=True,
-            capture_output=True,
-        )
-
-        service = WorktreeService(temp_git_repo)
-        result = service.create_worktree_from_existing(
+        run_git(temp_git_repo, "checkout", "-b", "456-fix-bug")
+        run_git(temp_git_repo, "checkout", "main")
+        result = worktree_service.create_worktree_from_existing(
             issue_number=456, feature_name="fix-bug", branch_name="456-fix-bug"
         )
 
@@ -242,15 +264,11 @@ class TestCreateWorktreeFromExistingContract:
         assert result.branch_name == "456-fix-bug"
 
     def test_create_worktree_from_existing_branch_not_found_raises_error(
-        self, temp_git_repo: Path
+        self, worktree_service: WorktreeService
     ) -> None:
         """create_worktree_from_existing should raise BranchNotFoundError."""
-        from worktree_manager.errors import BranchNotFoundError
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
         with pytest.raises(BranchNotFoundError) as exc_info:
-            service.create_worktree_from_existing(
+            worktree_service.create_worktree_from_existing(
                 issue_number=123,
                 feature_name="nonexistent",
                 branch_name="123-nonexistent",
@@ -271,59 +289,61 @@ class TestInitPlansContract:
     Contract: Given issue_number, creates .plans/{issue}/ structure.
     """
 
-    def test_init_plans_creates_directory_structure(self, temp_git_repo: Path) -> None:
+    @pytest.fixture
+    def plans_worktree(
+        self, created_worktree: tuple[WorktreeService, Worktree]
+    ) -> tuple[WorktreeService, Worktree]:
+        """Shared worktree with .plans/ removed so each test starts clean."""
+        _, wt = created_worktree
+        shutil.rmtree(wt.path / ".plans", ignore_errors=True)
+        return created_worktree
+
+    def test_init_plans_creates_directory_structure(
+        self, plans_worktree: tuple[WorktreeService, Worktree]
+    ) -> None:
         """init_plans should create .plans/{issue}/ with subdirectories."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-
-        # First create a worktree
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
+        service, wt = plans_worktree
 
         # Initialize plans
         service.init_plans(issue_number=123)
 
         # Verify structure
-        plans_path = wt.path / ".plans" / "123"
-        assert plans_path.exists()
-        assert (plans_path / "specs").is_dir()
-        assert (plans_path / "plans").is_dir()
-        assert (plans_path / "reviews").is_dir()
-        assert (plans_path / "README.md").is_file()
-
-    def test_init_plans_creates_readme_with_metadata(self, temp_git_repo: Path) -> None:
+        with os.scandir(wt.path / ".plans" / "123") as it:
+            entries = {entry.name: entry for entry in it}
+        assert entries["specs"].is_dir()
+        assert entries["plans"].is_dir()
+        assert entries["reviews"].is_dir()
+        assert entries["README.md"].is_file()
+
+    def test_init_plans_creates_readme_with_metadata(
+        self, plans_worktree: tuple[WorktreeService, Worktree]
+    ) -> None:
         """init_plans should create README.md with feature metadata."""
-        from worktree_manager.service import WorktreeService
+        service, wt = plans_worktree
+        service.init_plans(issue_number=123, feature_title="Fix Login Bug")
 
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=456, feature_name="fix-bug")
-        service.init_plans(issue_number=456, feature_title="Fix Login Bug")
-
-        readme_path = wt.path / ".plans" / "456" / "README.md"
+        readme_path = wt.path / ".plans" / "123" / "README.md"
         readme_content = readme_path.read_text()
 
-        assert "456" in readme_content
+        assert "123" in readme_content
         assert "Fix Login Bug" in readme_content
 
-    def test_init_plans_returns_plans_folder_model(self, temp_git_repo: Path) -> None:
+    def test_init_plans_returns_plans_folder_model(
+        self, plans_worktree: tuple[WorktreeService, Worktree]
+    ) -> None:
         """init_plans should return PlansFolder model."""
-        from worktree_manager.models import PlansFolder
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        service.create_worktree(issue_number=123, feature_name="add-auth")
+        service, _ = plans_worktree
         result = service.init_plans(issue_number=123)
 
         assert isinstance(result, PlansFolder)
         assert result.issue_number == 123
         assert result.is_complete is True
 
-    def test_init_plans_is_idempotent(self, temp_git_repo: Path) -> None:
+    def test_init_plans_is_idempotent(
+        self, plans_worktree: tuple[WorktreeService, Worktree]
+    ) -> None:
         """init_plans should be idempotent (re-running returns same result)."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
+        service, wt = plans_worktree
 
         # First call
         result1 = service.init_plans(issue_number=123)
@@ -346,39 +366,33 @@ class TestGetPlansContract:
     Contract: Given issue_number, returns PlansFolder if exists, None otherwise.
     """
 
-    def test_get_plans_returns_plans_folder_if_exists(self, temp_git_repo: Path) -> None:
+    def test_get_plans_returns_plans_folder_if_exists(
+        self, worktree_service: WorktreeService
+    ) -> None:
         """get_plans should return PlansFolder if .plans/{issue}/ exists."""
-        from worktree_manager.models import PlansFolder
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        service.create_worktree(issue_number=123, feature_name="add-auth")
-        service.init_plans(issue_number=123)
+        worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
+        worktree_service.init_plans(issue_number=123)
 
-        result = service.get_plans(issue_number=123)
+        result = worktree_service.get_plans(issue_number=123)
 
         assert isinstance(result, PlansFolder)
         assert result.issue_number == 123
         assert result.is_complete is True
 
-    def test_get_plans_returns_none_if_not_exists(self, temp_git_repo: Path) -> None:
+    def test_get_plans_returns_none_if_not_exists(self, worktree_service: WorktreeService) -> None:
         """get_plans should return None if .plans/{issue}/ doesn't exist."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        service.create_worktree(issue_number=123, feature_name="add-auth")
+        worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         # Don't init plans
-        result = service.get_plans(issue_number=123)
+        result = worktree_service.get_plans(issue_number=123)
 
         assert result is None
 
-    def test_get_plans_returns_partial_if_incomplete(self, temp_git_repo: Path) -> None:
+    def test_get_plans_returns_partial_if_incomplete(
+        self, worktree_service: WorktreeService
+    ) -> None:
         """get_plans should return PlansFolder with incomplete status if partial."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
+        wt = worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         # Manually create partial structure
         plans_path = wt.path / ".plans" / "123"
@@ -386,13 +400,28 @@ class TestGetPlansContract:
         (plans_path / "specs").mkdir()
         # Missing: plans/, reviews/, README.md
 
-        result = service.get_plans(issue_number=123)
+        result = worktree_service.get_plans(issue_number=123)
 
         assert result is not None
         assert result.has_specs is True
         assert result.has_plans is False
         assert result.is_complete is False
 
+    def test_get_plans_unreadable_folder_reports_empty(
+        self, worktree_service: WorktreeService
+    ) -> None:
+        """get_plans should treat an unreadable .plans/{issue}/ as present but empty."""
+        wt = worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
+        (wt.path / ".plans" / "123").mkdir(parents=True)
+
+        with patch("worktree_manager.service.os.scandir", side_effect=PermissionError):
+            result = worktree_service.get_plans(issue_number=123)
+
+        assert result is not None
+        assert result.has_specs is False
+        assert result.has_readme is False
+        assert result.is_complete is False
+
 
 # =============================================================================
 # US3: commit_and_push() and push() contracts
@@ -406,19 +435,15 @@ class TestCommitAndPushContract:
     Contract: Stage, commit, and optionally push changes in worktree.
     """
 
-    def test_commit_and_push_with_changes(self, temp_git_repo: Path) -> None:
+    def test_commit_and_push_with_changes(self, worktree_service: WorktreeService) -> None:
         """commit_and_push should commit changes and return result."""
-        from worktree_manager.models import CommitResult
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
+        wt = worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         # Make a change in the worktree
         test_file = wt.path / "test.txt"
         test_file.write_text("Hello World\n")
 
-        result = service.commit_and_push(
+        result = worktree_service.commit_and_push(
             issue_number=123,
             message="Add test file",
             push=False,  # No remote to push to in test
@@ -429,15 +454,12 @@ class TestCommitAndPushContract:
         assert len(result.commit_sha) > 0
         assert result.nothing_to_commit is False
 
-    def test_commit_and_push_nothing_to_commit(self, temp_git_repo: Path) -> None:
+    def test_commit_and_push_nothing_to_commit(self, worktree_service: WorktreeService) -> None:
         """commit_and_push should handle nothing to commit."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        service.create_worktree(issue_number=123, feature_name="add-auth")
+        worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         # Don't make any changes
-        result = service.commit_and_push(
+        result = worktree_service.commit_and_push(
             issue_number=123,
             message="Nothing",
             push=False,
@@ -446,18 +468,42 @@ class TestCommitAndPushContract:
         assert result.nothing_to_commit is True
         assert result.commit_sha is None
 
-    def test_commit_and_push_stages_all_changes(self, temp_git_repo: Path) -> None:
-        """commit_and_push should stage all changes (new, modified, deleted)."""
-        from worktree_manager.service import WorktreeService
+    def test_commit_and_push_no_checkout_worktree_keeps_tracked_files(
+        self, worktree_service: WorktreeService
+    ) -> None:
+        """commit_and_push should never commit a no-checkout worktree as deletions."""
+        wt = worktree_service.create_worktree(
+            issue_number=123, feature_name="add-auth", checkout=False
+        )
+        worktree_service.init_plans(123)
+
+        with pytest.raises(WorktreeNotPopulatedError):
+            worktree_service.commit_and_push(issue_number=123, message="plans", push=False)
 
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
+        worktree_service.checkout_worktree(123)
+        result = worktree_service.commit_and_push(issue_number=123, message="plans", push=False)
+
+        assert result.commit_sha is not None
+        changes = subprocess.run(
+            ["git", "show", "--name-status", "--format=", "HEAD"],
+            cwd=wt.path,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+        assert changes
+        assert all(line.startswith("A\t.plans/123/") for line in changes)
+        assert (wt.path / "README.md").exists()
+
+    def test_commit_and_push_stages_all_changes(self, worktree_service: WorktreeService) -> None:
+        """commit_and_push should stage all changes (new, modified, deleted)."""
+        wt = worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         # Create multiple files
         (wt.path / "new_file.txt").write_text("new content\n")
         (wt.path / "another.txt").write_text("more content\n")
 
-        result = service.commit_and_push(
+        result = worktree_service.commit_and_push(
             issue_number=123,
             message="Add multiple files",
             push=False,
@@ -484,19 +530,16 @@ class TestPushContract:
     Note: These tests are limited since we don't have a real remote.
     """
 
-    def test_push_without_remote_returns_error(self, temp_git_repo: Path) -> None:
+    def test_push_without_remote_returns_error(self, worktree_service: WorktreeService) -> None:
         """push should handle missing remote gracefully."""
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
+        wt = worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         # Make and commit a change
         (wt.path / "test.txt").write_text("test\n")
-        service.commit_and_push(issue_number=123, message="test", push=False)
+        worktree_service.commit_and_push(issue_number=123, message="test", push=False)
 
         # Try to push without remote configured
-        result = service.push(issue_number=123)
+        result = worktree_service.push(issue_number=123)
 
         # Should return False since there's no remote
         assert result is False
@@ -514,81 +557,64 @@ class TestRemoveWorktreeContract:
     Contract: Remove worktree and optionally delete branches.
     """
 
-    def test_remove_worktree_removes_directory(self, temp_git_repo: Path) -> None:
-        """remove_worktree should remove the worktree directory."""
-        from worktree_manager.models import OperationStatus
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
-
-        # Verify worktree exists
+    @pytest.mark.parametrize(
+        ("delete_branch", "force", "dirty"),
+        [
+            pytest.param(False, False, False, id="removes-directory"),
+            pytest.param(True, False, False, id="with-delete-branch"),
+            pytest.param(False, True, True, id="force-with-changes"),
+        ],
+    )
+    def test_remove_worktree_succeeds(
+        self,
+        temp_git_repo: Path,
+        worktree_service: WorktreeService,
+        delete_branch: bool,
+        force: bool,
+        dirty: bool,
+    ) -> None:
+        """remove_worktree should remove the directory and delete the branch on request."""
+        wt = worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
         assert wt.path.exists()
 
-        result = service.remove_worktree(issue_number=123)
+        if dirty:
+            # Make uncommitted change
+            (wt.path / "dirty.txt").write_text("dirty\n")
 
-        assert result.status == OperationStatus.SUCCESS
-        assert not wt.path.exists()
-
-    def test_remove_worktree_with_delete_branch(self, temp_git_repo: Path) -> None:
-        """remove_worktree should delete local branch when requested."""
-        from worktree_manager.models import OperationStatus
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        service.create_worktree(issue_number=123, feature_name="add-auth")
-
-        result = service.remove_worktree(issue_number=123, delete_branch=True)
+        result = worktree_service.remove_worktree(
+            issue_number=123, delete_branch=delete_branch, force=force
+        )
 
         assert result.status == OperationStatus.SUCCESS
+        assert not wt.path.exists()
 
-        # Branch should be deleted
+        # Branch is only deleted when requested
         branch_check = subprocess.run(
             ["git", "show-ref", "--verify", "refs/heads/123-add-auth"],
             cwd=temp_git_repo,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
-        assert branch_check.returncode != 0  # Branch doesn't exist
+        assert (branch_check.returncode != 0) is delete_branch
 
-    def test_remove_worktree_uncommitted_changes_fails(self, temp_git_repo: Path) -> None:
+    def test_remove_worktree_uncommitted_changes_fails(
+        self, worktree_service: WorktreeService
+    ) -> None:
         """remove_worktree should fail with uncommitted changes."""
-        from worktree_manager.errors import UncommittedChangesError
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
+        wt = worktree_service.create_worktree(issue_number=123, feature_name="add-auth")
 
         # Make uncommitted change
         (wt.path / "dirty.txt").write_text("dirty\n")
 
         with pytest.raises(UncommittedChangesError):
-            service.remove_worktree(issue_number=123)
+            worktree_service.remove_worktree(issue_number=123)
 
         # Worktree should still exist
         assert wt.path.exists()
 
-    def test_remove_worktree_force_with_changes(self, temp_git_repo: Path) -> None:
-        """remove_worktree with force should remove even with uncommitted changes."""
-        from worktree_manager.models import OperationStatus
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-        wt = service.create_worktree(issue_number=123, feature_name="add-auth")
-
-        # Make uncommitted change
-        (wt.path / "dirty.txt").write_text("dirty\n")
-
-        result = service.remove_worktree(issue_number=123, force=True)
-
-        assert result.status == OperationStatus.SUCCESS
-        assert not wt.path.exists()
-
-    def test_remove_worktree_not_found_raises_error(self, temp_git_repo: Path) -> None:
+    def test_remove_worktree_not_found_raises_error(
+        self, worktree_service: WorktreeService
+    ) -> None:
         """remove_worktree should raise error if worktree doesn't exist."""
-        from worktree_manager.errors import WorktreeNotFoundError
-        from worktree_manager.service import WorktreeService
-
-        service = WorktreeService(temp_git_repo)
-
         with pytest.raises(WorktreeNotFoundError):
-            service.remove_worktree(issue_number=999)
+            worktree_service.remove_worktree(issue_number=999)
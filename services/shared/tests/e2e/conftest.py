@@ -9,13 +9,14 @@ Set these environment variables:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from github_integration import GitHubService
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def github_app_id():
     """Get GitHub App ID from environment."""
     value = os.environ.get("GITHUB_APP_ID")
@@ -24,7 +25,7 @@ def github_app_id():
     return value
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def github_installation_id():
     """Get GitHub Installation ID from environment."""
     value = os.environ.get("GITHUB_INSTALLATION_ID")
@@ -33,7 +34,7 @@ def github_installation_id():
     return value
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def github_private_key_path():
     """Get GitHub private key path from environment."""
     value = os.environ.get("GITHUB_PRIVATE_KEY_PATH")
@@ -42,22 +43,23 @@ def github_private_key_path():
     return value
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def github_repository():
     """Get GitHub repository from environment."""
     value = os.environ.get("GITHUB_REPOSITORY", "farmer1st/farmer-code-tests")
     return value
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def service(github_app_id, github_installation_id, github_private_key_path, github_repository):
     """Create GitHubService instance for e2e testing."""
-    return GitHubService(
+    with GitHubService(
         app_id=github_app_id,
         installation_id=github_installation_id,
         private_key_path=github_private_key_path,
         repository=github_repository,
-    )
+    ) as github_service:
+        yield github_service
 
 
 @pytest.fixture
@@ -77,9 +79,12 @@ def auto_cleanup_issue(service):
 
     yield _create
 
-    # Cleanup: close all created issues
-    for issue_number in created_issues:
+    # Cleanup: close all created issues concurrently
+    def _close(issue_number: int) -> None:
         try:
             service.update_issue(issue_number, state="closed")
         except Exception:
             pass  # Ignore cleanup errors
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        pool.map(_close, created_issues)
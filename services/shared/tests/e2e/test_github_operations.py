@@ -19,12 +19,33 @@ Run with: pytest tests/e2e/ -v -m e2e
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 
 from github_integration import Issue
 
 
+def wait_for(predicate, timeout: float = 10.0, interval: float = 0.5) -> bool:
+    """Poll until predicate() is true or timeout expires.
+
+    Backs off exponentially from 50ms up to `interval` between polls, so a
+    condition that holds quickly is seen without waiting a full interval.
+    Exceptions raised by the predicate count as "not yet".
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        try:
+            if predicate():
+                return True
+        except Exception:
+            pass
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 1.6, interval)
+    return False
+
+
 def wait_for_issue_in_list(
     service,
     issue_number: int,
@@ -34,16 +55,14 @@ def wait_for_issue_in_list(
     interval: float = 0.5,
 ) -> bool:
     """Poll until issue appears in list_issues results."""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            issues = service.list_issues(state=state, labels=labels)
-            if any(issue.number == issue_number for issue in issues):
-                return True
-        except Exception:
-            pass
-        time.sleep(interval)
-    return False
+    filters = {"state": state} if state is not None else {}
+    return wait_for(
+        lambda: any(
+            issue.number == issue_number for issue in service.list_issues(labels=labels, **filters)
+        ),
+        timeout=timeout,
+        interval=interval,
+    )
 
 
 @pytest.mark.e2e
@@ -59,7 +78,7 @@ class TestFullIssueLifecycle:
     """
 
     @pytest.mark.journey("ORC-001")
-    def test_full_issue_lifecycle(self, service, auto_cleanup_issue):
+    def test_full_issue_lifecycle(self, service, auto_cleanup_issue, github_repository):
         """
         Full e2e test: Create → Retrieve → List
 
@@ -87,10 +106,10 @@ class TestFullIssueLifecycle:
         assert created_issue.number > 0
         assert created_issue.title == title
         assert created_issue.body == body
-        assert set(labels).issubset(set(created_issue.labels))
-        assert "test:automated" in created_issue.labels  # Added by auto_cleanup_issue
+        # test:automated is added by auto_cleanup_issue
+        assert {*labels, "test:automated"} <= set(created_issue.labels)
         assert created_issue.state == "open"
-        assert created_issue.repository == "farmer1st/farmer-code-tests"
+        assert created_issue.repository == github_repository
 
         # Step 2: Retrieve issue by number
         retrieved_issue = service.get_issue(created_issue.number)
@@ -99,20 +118,15 @@ class TestFullIssueLifecycle:
         assert retrieved_issue.number == created_issue.number
         assert retrieved_issue.title == created_issue.title
         assert retrieved_issue.body == created_issue.body
-        assert set(labels).issubset(set(retrieved_issue.labels))
+        assert set(labels) <= set(retrieved_issue.labels)
         assert retrieved_issue.state == created_issue.state
 
-        # Step 3: Wait for issue to appear in list (handles eventual consistency)
-        # Note: GitHub API may take a moment to index newly created issues
-        assert wait_for_issue_in_list(service, created_issue.number, state="open", timeout=10.0), (
-            f"Issue #{created_issue.number} did not appear in list after 10s"
-        )
-
-        # Step 4: Wait for issue to appear in label-filtered list
-        # Note: Label indexing may have additional delay
+        # Step 3: Wait for issue to appear in the open, label-filtered list
+        # Note: GitHub API may take a moment to index newly created issues and labels;
+        # filtering on both at once checks state and labels in a single poll loop
         assert wait_for_issue_in_list(
-            service, created_issue.number, labels=["test"], timeout=10.0
-        ), f"Issue #{created_issue.number} did not appear in label-filtered list after 10s"
+            service, created_issue.number, state="open", labels=["test"], timeout=10.0
+        ), f"Issue #{created_issue.number} did not appear in open label-filtered list after 10s"
 
     @pytest.mark.journey("ORC-005")
     def test_create_multiple_issues(self, service, auto_cleanup_issue):
@@ -140,14 +154,17 @@ class TestFullIssueLifecycle:
         issue_numbers = [issue.number for issue in issues]
         assert len(issue_numbers) == len(set(issue_numbers))
 
-        # Verify all can be retrieved
-        for created_issue in issues:
-            retrieved = service.get_issue(created_issue.number)
+        # Verify all can be retrieved (independent GETs, issued concurrently)
+        with ThreadPoolExecutor(max_workers=len(issues)) as pool:
+            retrieved_issues = list(pool.map(service.get_issue, issue_numbers))
+        for created_issue, retrieved in zip(issues, retrieved_issues, strict=True):
             assert retrieved.number == created_issue.number
             assert retrieved.title == created_issue.title
 
-        # Verify all appear in list (with polling for eventual consistency)
-        for created_issue in issues:
-            assert wait_for_issue_in_list(
-                service, created_issue.number, labels=["batch"], timeout=10.0
-            ), f"Issue #{created_issue.number} not found in batch list after 10s"
+        # Verify all appear in list (with polling for eventual consistency);
+        # one list call per poll checks every issue at once
+        expected = set(issue_numbers)
+        assert wait_for(
+            lambda: expected <= {issue.number for issue in service.list_issues(labels=["batch"])},
+            timeout=10.0,
+        ), f"Issues {sorted(expected)} not all found in batch list after 10s"
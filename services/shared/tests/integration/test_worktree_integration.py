@@ -10,13 +10,15 @@ from pathlib import Path
 
 import pytest
 
+pytestmark = pytest.mark.usefixtures("isolated_git_config")
+
 
 @pytest.fixture
 def temp_git_repo(tmp_path: Path) -> Path:
     """Create a temporary git repository for testing."""
     repo_path = tmp_path / "test-repo"
     repo_path.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    subprocess.run(["git", "init", "--template="], cwd=repo_path, check=True, capture_output=True)
     subprocess.run(
         ["git", "config", "user.email", "test@test.com"],
         cwd=repo_path,
@@ -285,7 +287,12 @@ class TestErrorScenarios:
         # Create repo with no main branch
         repo_path = tmp_path / "no-main-repo"
         repo_path.mkdir()
-        subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+        subprocess.run(
+            ["git", "init", "--template="],
+            cwd=repo_path,
+            check=True,
+            capture_output=True,
+        )
         subprocess.run(
             ["git", "config", "user.email", "test@test.com"],
             cwd=repo_path,
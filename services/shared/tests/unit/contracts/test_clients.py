@@ -0,0 +1,68 @@
+"""
+Unit Tests for Contract HTTP Clients
+
+Tests what the clients put on the wire, using httpx.MockTransport:
+- POST requests send the model as a JSON body with a JSON Content-Type
+- GET requests send no body and no Content-Type
+"""
+
+import json
+from functools import partial
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from contracts.clients.orchestrator import OrchestratorClient
+from contracts.models.workflow import WorkflowType
+
+
+@pytest.fixture
+def requests_seen(monkeypatch):
+    """Route client traffic to a MockTransport and record each request"""
+    seen: list[httpx.Request] = []
+    workflow = {
+        "id": str(uuid4()),
+        "workflow_type": "specify",
+        "status": "in_progress",
+        "feature_id": "001-add-auth",
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=workflow)
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(httpx, "AsyncClient", partial(httpx.AsyncClient, transport=transport))
+    return seen
+
+
+class TestOrchestratorClientWire:
+    """Tests for the bodies and headers OrchestratorClient sends"""
+
+    async def test_post_sends_json_body_with_content_type(self, requests_seen):
+        """create_workflow should POST the serialized request as JSON"""
+        async with OrchestratorClient("http://orchestrator") as client:
+            await client.create_workflow(WorkflowType.SPECIFY, "Add OAuth2 authentication")
+
+        request = requests_seen[0]
+        assert request.method == "POST"
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {
+            "workflow_type": "specify",
+            "feature_description": "Add OAuth2 authentication",
+            "context": None,
+        }
+
+    async def test_get_sends_no_body_or_content_type(self, requests_seen):
+        """get_workflow should not send a body or Content-Type"""
+        workflow_id = uuid4()
+        async with OrchestratorClient("http://orchestrator") as client:
+            await client.get_workflow(workflow_id)
+
+        request = requests_seen[0]
+        assert request.method == "GET"
+        assert request.url.path == f"/workflows/{workflow_id}"
+        assert "Content-Type" not in request.headers
+        assert request.content == b""
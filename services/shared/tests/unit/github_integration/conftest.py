@@ -0,0 +1,22 @@
+"""Fixtures for GitHubAPIClient unit tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from src.github_integration.auth import GitHubAppAuth
+from src.github_integration.client import GitHubAPIClient
+
+
+@pytest.fixture
+def mock_auth():
+    """Create a mock GitHubAppAuth instance"""
+    auth = MagicMock(spec=GitHubAppAuth)
+    auth.get_installation_token.return_value = "test-token-12345"
+    return auth
+
+
+@pytest.fixture
+def client(mock_auth):
+    """Create a GitHubAPIClient with mocked auth"""
+    with GitHubAPIClient(auth=mock_auth, repository="owner/repo") as api_client:
+        yield api_client
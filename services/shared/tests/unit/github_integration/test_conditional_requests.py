@@ -0,0 +1,120 @@
+"""
+Unit Tests for Conditional Requests
+
+Tests the ETag revalidation behavior of GitHubAPIClient:
+- Repeated GETs send If-None-Match with the cached ETag
+- 304 Not Modified returns the cached body
+- Only GET responses are cached, keyed by the full request URL
+- Cached bodies are copied, so callers cannot corrupt them
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+def make_response(status_code, data=None, etag=None):
+    """Build a mock requests.Response"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"ETag": etag} if etag else {}
+    response.text = "" if data is None else "{...}"
+    response.json.return_value = data
+    return response
+
+
+class TestConditionalGet:
+    """Tests for ETag-based conditional GET requests"""
+
+    def test_first_get_is_unconditional(self, client):
+        """First GET should not send If-None-Match"""
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value = make_response(200, {"id": 1}, etag='"abc"')
+
+            client.get("/test")
+
+            headers = mock_request.call_args.kwargs["headers"]
+            assert "If-None-Match" not in headers
+
+    def test_not_modified_returns_cached_body(self, client):
+        """Second GET should revalidate and reuse the body on 304"""
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                make_response(200, {"id": 1}, etag='"abc"'),
+                make_response(304),
+            ]
+
+            first = client.get("/test")
+            second = client.get("/test")
+
+            assert second == first == {"id": 1}
+            headers = mock_request.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"abc"'
+
+    def test_modified_response_replaces_cache(self, client):
+        """A 200 on revalidation should return and cache the new body"""
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                make_response(200, {"id": 1}, etag='"abc"'),
+                make_response(200, {"id": 2}, etag='"def"'),
+                make_response(304),
+            ]
+
+            client.get("/test")
+            assert client.get("/test") == {"id": 2}
+            assert client.get("/test") == {"id": 2}
+
+            headers = mock_request.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"def"'
+
+    def test_params_are_part_of_cache_key(self, client):
+        """GETs with different params should not share an ETag"""
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                make_response(200, [1], etag='"open"'),
+                make_response(200, [2], etag='"closed"'),
+            ]
+
+            client.get("/issues", params={"state": "open"})
+            client.get("/issues", params={"state": "closed"})
+
+            headers = mock_request.call_args.kwargs["headers"]
+            assert "If-None-Match" not in headers
+
+    def test_list_valued_params_are_cacheable(self, client):
+        """GETs with list-valued params should be sent and revalidated"""
+        params = {"labels": ["bug", "ui"]}
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                make_response(200, [1], etag='"abc"'),
+                make_response(304),
+            ]
+
+            assert client.get("/issues", params=params) == [1]
+            assert client.get("/issues", params=params) == [1]
+
+            headers = mock_request.call_args.kwargs["headers"]
+            assert headers["If-None-Match"] == '"abc"'
+
+    def test_mutating_result_does_not_change_cache(self, client):
+        """Callers mutating a returned body should not affect later cached reads"""
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.side_effect = [
+                make_response(200, {"labels": ["bug"]}, etag='"abc"'),
+                make_response(304),
+                make_response(304),
+            ]
+
+            client.get("/test")["labels"].append("first")
+            client.get("/test")["labels"].append("second")
+
+            assert client.get("/test") == {"labels": ["bug"]}
+
+    def test_non_get_requests_are_not_cached(self, client):
+        """POST responses should never be revalidated"""
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value = make_response(201, {"id": 1}, etag='"abc"')
+
+            client.post("/test", json={"a": 1})
+            client.post("/test", json={"a": 1})
+
+            headers = mock_request.call_args.kwargs["headers"]
+            assert "If-None-Match" not in headers
@@ -4,7 +4,7 @@ Unit Tests for Retry Logic
 Tests the retry behavior of GitHubAPIClient for various error scenarios:
 - Server errors (5xx) trigger retries
 - Network errors (ConnectionError, Timeout) trigger retries
-- Client errors (404, 429) do not trigger retries
+- Client errors (403, 404, 429) do not trigger retries
 - Max retries respected
 - Retry delay applied between attempts
 """
@@ -22,20 +22,6 @@ from src.github_integration.errors import (
 )
 
 
-@pytest.fixture
-def mock_auth():
-    """Create a mock GitHubAppAuth instance"""
-    auth = MagicMock()
-    auth.get_installation_token.return_value = "test-token-12345"
-    return auth
-
-
-@pytest.fixture
-def client(mock_auth):
-    """Create a GitHubAPIClient with mocked auth"""
-    return GitHubAPIClient(auth=mock_auth, repository="owner/repo")
-
-
 class TestRetryOnServerErrors:
     """Tests for retry behavior on 5xx server errors"""
 
@@ -50,7 +36,7 @@ class TestRetryOnServerErrors:
         mock_response_success.text = '{"id": 1}'
         mock_response_success.json.return_value = {"id": 1}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep") as mock_sleep:
                 mock_request.side_effect = [mock_response_fail, mock_response_success]
 
@@ -71,7 +57,7 @@ class TestRetryOnServerErrors:
         mock_response_success.text = '{"status": "ok"}'
         mock_response_success.json.return_value = {"status": "ok"}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep"):
                 mock_request.side_effect = [mock_response_fail, mock_response_success]
 
@@ -91,7 +77,7 @@ class TestRetryOnServerErrors:
         mock_response_success.text = '{"result": "done"}'
         mock_response_success.json.return_value = {"result": "done"}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep"):
                 mock_request.side_effect = [mock_response_fail, mock_response_success]
 
@@ -105,7 +91,7 @@ class TestRetryOnServerErrors:
         mock_response_fail.status_code = 500
         mock_response_fail.text = "Internal Server Error"
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep") as mock_sleep:
                 mock_request.return_value = mock_response_fail
 
@@ -128,7 +114,7 @@ class TestRetryOnServerErrors:
         mock_response_success.text = "{}"
         mock_response_success.json.return_value = {}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep") as mock_sleep:
                 mock_request.side_effect = [
                     mock_response_fail,
@@ -142,6 +128,46 @@ class TestRetryOnServerErrors:
                 assert mock_sleep.call_count == 2
                 mock_sleep.assert_any_call(1)
 
+    def test_retry_honors_retry_after_header(self, client):
+        """Should wait for the server-requested Retry-After delay"""
+        mock_response_fail = MagicMock()
+        mock_response_fail.status_code = 503
+        mock_response_fail.text = "Service Unavailable"
+        mock_response_fail.headers = {"Retry-After": "5"}
+
+        mock_response_success = MagicMock()
+        mock_response_success.status_code = 200
+        mock_response_success.text = "{}"
+        mock_response_success.json.return_value = {}
+
+        with patch.object(client._session, "request") as mock_request:
+            with patch("src.github_integration.client.time.sleep") as mock_sleep:
+                mock_request.side_effect = [mock_response_fail, mock_response_success]
+
+                client.get("/test")
+
+                mock_sleep.assert_called_once_with(5)
+
+    def test_retry_after_is_capped(self, client):
+        """Should not wait longer than MAX_RETRY_AFTER"""
+        mock_response_fail = MagicMock()
+        mock_response_fail.status_code = 503
+        mock_response_fail.text = "Service Unavailable"
+        mock_response_fail.headers = {"Retry-After": "86400"}
+
+        mock_response_success = MagicMock()
+        mock_response_success.status_code = 200
+        mock_response_success.text = "{}"
+        mock_response_success.json.return_value = {}
+
+        with patch.object(client._session, "request") as mock_request:
+            with patch("src.github_integration.client.time.sleep") as mock_sleep:
+                mock_request.side_effect = [mock_response_fail, mock_response_success]
+
+                client.get("/test")
+
+                mock_sleep.assert_called_once_with(GitHubAPIClient.MAX_RETRY_AFTER)
+
 
 class TestRetryOnNetworkErrors:
     """Tests for retry behavior on network errors"""
@@ -153,7 +179,7 @@ class TestRetryOnNetworkErrors:
         mock_response_success.text = '{"id": 42}'
         mock_response_success.json.return_value = {"id": 42}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep"):
                 mock_request.side_effect = [
                     requests.ConnectionError("Connection refused"),
@@ -172,7 +198,7 @@ class TestRetryOnNetworkErrors:
         mock_response_success.text = '{"success": true}'
         mock_response_success.json.return_value = {"success": True}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep"):
                 mock_request.side_effect = [
                     requests.Timeout("Read timed out"),
@@ -186,7 +212,7 @@ class TestRetryOnNetworkErrors:
 
     def test_network_error_exhausts_retries(self, client):
         """Should raise ServerError after network errors exhaust retries"""
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             with patch("src.github_integration.client.time.sleep"):
                 mock_request.side_effect = requests.ConnectionError("Connection refused")
 
@@ -208,7 +234,7 @@ class TestNoRetryOnClientErrors:
         mock_response.text = "Not Found"
         mock_response.headers = {}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             with pytest.raises(ResourceNotFoundError):
@@ -224,7 +250,7 @@ class TestNoRetryOnClientErrors:
         mock_response.text = "Rate limit exceeded"
         mock_response.headers = {"X-RateLimit-Reset": str(int(time.time()) + 3600)}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             with pytest.raises(RateLimitExceeded):
@@ -246,7 +272,7 @@ class TestRateLimitHandling:
         mock_response.text = "Rate limit exceeded"
         mock_response.headers = {"X-RateLimit-Reset": str(future_time)}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             with pytest.raises(RateLimitExceeded) as exc_info:
@@ -263,7 +289,7 @@ class TestRateLimitHandling:
         mock_response.text = "Rate limit exceeded"
         mock_response.headers = {}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             with pytest.raises(RateLimitExceeded) as exc_info:
@@ -272,6 +298,53 @@ class TestRateLimitHandling:
             # Should default to at least 1 hour (3600 seconds)
             assert exc_info.value.wait_seconds >= 3600
 
+    def test_secondary_rate_limit_uses_retry_after(self, client):
+        """403 with Retry-After should raise RateLimitExceeded without retrying"""
+        mock_response = MagicMock()
+        mock_response.status_code = 403
+        mock_response.text = "You have exceeded a secondary rate limit"
+        mock_response.headers = {"Retry-After": "30"}
+
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value = mock_response
+
+            with pytest.raises(RateLimitExceeded) as exc_info:
+                client.get("/test")
+
+            assert exc_info.value.wait_seconds == 30
+            assert mock_request.call_count == 1
+
+    def test_secondary_rate_limit_caps_retry_after(self, client):
+        """403 Retry-After should be capped like 5xx retry delays"""
+        mock_response = MagicMock()
+        mock_response.status_code = 403
+        mock_response.text = "You have exceeded a secondary rate limit"
+        mock_response.headers = {"Retry-After": "3600"}
+
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value = mock_response
+
+            with pytest.raises(RateLimitExceeded) as exc_info:
+                client.get("/test")
+
+            assert exc_info.value.wait_seconds == GitHubAPIClient.MAX_RETRY_AFTER
+
+    def test_forbidden_without_rate_limit_headers_is_not_rate_limit(self, client):
+        """Plain 403 should surface as an HTTP error, not a rate limit"""
+        mock_response = MagicMock()
+        mock_response.status_code = 403
+        mock_response.text = "Resource not accessible by integration"
+        mock_response.headers = {"X-RateLimit-Remaining": "4999"}
+        mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
+
+        with patch.object(client._session, "request") as mock_request:
+            mock_request.return_value = mock_response
+
+            with pytest.raises(ServerError) as exc_info:
+                client.get("/test")
+
+            assert exc_info.value.status_code == 403
+
 
 class TestSuccessfulRequests:
     """Tests for successful request handling"""
@@ -283,7 +356,7 @@ class TestSuccessfulRequests:
         mock_response.text = '{"data": "value"}'
         mock_response.json.return_value = {"data": "value"}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             result = client.get("/test")
@@ -297,7 +370,7 @@ class TestSuccessfulRequests:
         mock_response.status_code = 204
         mock_response.text = ""
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             result = client.delete("/test")
@@ -311,7 +384,7 @@ class TestSuccessfulRequests:
         mock_response.text = "{}"
         mock_response.json.return_value = {}
 
-        with patch("src.github_integration.client.requests.request") as mock_request:
+        with patch.object(client._session, "request") as mock_request:
             mock_request.return_value = mock_response
 
             client.get("/test")
@@ -0,0 +1,31 @@
+"""
+Unit Tests for HTTP Session Lifecycle
+
+Tests that GitHubAPIClient releases its pooled requests.Session:
+- close() closes the session
+- Leaving the client's context closes the session
+"""
+
+from unittest.mock import patch
+
+from src.github_integration.client import GitHubAPIClient
+
+
+class TestSessionLifecycle:
+    """Tests for closing the pooled HTTP session"""
+
+    def test_close_closes_session(self, client):
+        """close() should close the underlying session"""
+        with patch.object(client._session, "close") as mock_close:
+            client.close()
+
+        mock_close.assert_called_once_with()
+
+    def test_context_manager_closes_session(self, mock_auth):
+        """Exiting the context should close the underlying session"""
+        api_client = GitHubAPIClient(auth=mock_auth, repository="owner/repo")
+        with patch.object(api_client._session, "close") as mock_close:
+            with api_client:
+                mock_close.assert_not_called()
+
+        mock_close.assert_called_once_with()
@@ -10,6 +10,8 @@ from unittest.mock import patch
 
 import pytest
 
+pytestmark = pytest.mark.usefixtures("isolated_git_config")
+
 
 class TestGitClient:
     """Tests for GitClient class."""
@@ -79,13 +81,75 @@ class TestGitClient:
 
         assert result.returncode != 0
 
+    def test_remote_branch_exists_reuses_ls_remote(self, temp_git_repo: Path) -> None:
+        """branch_exists(remote=True) should answer repeated hits from one ls-remote."""
+        from worktree_manager.git_client import GitClient
+
+        origin = temp_git_repo.parent / "origin.git"
+        subprocess.run(
+            ["git", "clone", "--bare", str(temp_git_repo), str(origin)],
+            check=True,
+            capture_output=True,
+        )
+        subprocess.run(
+            ["git", "remote", "add", "origin", str(origin)],
+            cwd=temp_git_repo,
+            check=True,
+            capture_output=True,
+        )
+
+        client = GitClient(temp_git_repo)
+        with patch.object(client, "run_command", wraps=client.run_command) as mock_run:
+            assert client.branch_exists("main", remote=True) is True
+            assert client.branch_exists("main", remote=True) is True
+
+        assert mock_run.call_count == 1
+
+    def test_remote_branch_exists_rechecks_origin_on_cache_miss(self, temp_git_repo: Path) -> None:
+        """A branch pushed elsewhere after the cached ls-remote should still be found."""
+        from worktree_manager.git_client import GitClient
+
+        client = GitClient(temp_git_repo)
+        before_push = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="abc123\trefs/heads/main\n", stderr=""
+        )
+        after_push = subprocess.CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout="abc123\trefs/heads/main\ndef456\trefs/heads/123-add-auth\n",
+            stderr="",
+        )
+        with patch.object(client, "run_command", side_effect=[before_push, after_push]) as mock_run:
+            assert client.branch_exists("main", remote=True) is True
+            assert client.branch_exists("123-add-auth", remote=True) is True
+
+        assert mock_run.call_count == 2
+
+    def test_remote_branch_exists_does_not_cache_ls_remote_failure(
+        self, temp_git_repo: Path
+    ) -> None:
+        """A failed ls-remote should not hide remote branches until the TTL expires."""
+        from worktree_manager.git_client import GitClient
+
+        client = GitClient(temp_git_repo)
+        failed = subprocess.CompletedProcess(args=[], returncode=128, stdout="", stderr="")
+        listed = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="abc123\trefs/heads/main\n", stderr=""
+        )
+        with patch.object(client, "run_command", side_effect=[failed, listed]) as mock_run:
+            assert client.branch_exists("main", remote=True) is False
+            assert client.branch_exists("main", remote=True) is True
+            assert client.branch_exists("main", remote=True) is True
+
+        assert mock_run.call_count == 2
+
 
 @pytest.fixture
 def temp_git_repo(tmp_path: Path) -> Path:
     """Create a temporary git repository for testing."""
     repo_path = tmp_path / "test-repo"
     repo_path.mkdir()
-    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
+    subprocess.run(["git", "init", "--template="], cwd=repo_path, check=True, capture_output=True)
     subprocess.run(
         ["git", "config", "user.email", "test@test.com"],
         cwd=repo_path,
@@ -209,30 +209,29 @@ class TestCreateWorktreeRequestModel:
         with pytest.raises(ValidationError):
             CreateWorktreeRequest(issue_number=-1, feature_name="test")
 
-    def test_create_request_feature_name_pattern(self) -> None:
-        """CreateWorktreeRequest should validate feature_name pattern."""
+    @pytest.mark.parametrize("feature_name", ["a", "add-auth", "feature-123"])
+    def test_create_request_feature_name_pattern_valid(self, feature_name: str) -> None:
+        """CreateWorktreeRequest should accept lowercase hyphenated names."""
         from worktree_manager.models import CreateWorktreeRequest
 
-        # Valid names
-        CreateWorktreeRequest(issue_number=1, feature_name="a")
-        CreateWorktreeRequest(issue_number=1, feature_name="add-auth")
-        CreateWorktreeRequest(issue_number=1, feature_name="feature-123")
-
-        # Invalid: empty
-        with pytest.raises(ValidationError):
-            CreateWorktreeRequest(issue_number=1, feature_name="")
-
-        # Invalid: starts with hyphen
-        with pytest.raises(ValidationError):
-            CreateWorktreeRequest(issue_number=1, feature_name="-invalid")
-
-        # Invalid: ends with hyphen
-        with pytest.raises(ValidationError):
-            CreateWorktreeRequest(issue_number=1, feature_name="invalid-")
+        req = CreateWorktreeRequest(issue_number=1, feature_name=feature_name)
+        assert req.feature_name == feature_name
+
+    @pytest.mark.parametrize(
+        "feature_name",
+        [
+            "",  # empty
+            "-invalid",  # starts with hyphen
+            "invalid-",  # ends with hyphen
+            "InvalidName",  # uppercase (should be lowercase)
+        ],
+    )
+    def test_create_request_feature_name_pattern_invalid(self, feature_name: str) -> None:
+        """CreateWorktreeRequest should reject names outside the pattern."""
+        from worktree_manager.models import CreateWorktreeRequest
 
-        # Invalid: uppercase (should be lowercase)
         with pytest.raises(ValidationError):
-            CreateWorktreeRequest(issue_number=1, feature_name="InvalidName")
+            CreateWorktreeRequest(issue_number=1, feature_name=feature_name)
 
 
 # =============================================================================
@@ -5,10 +5,13 @@ Tests list_worktrees, get_worktree, and get_branch methods.
 Uses mocking to test the service in isolation from git.
 """
 
+import subprocess
 from datetime import UTC, datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+from worktree_manager.git_client import GitClient
+
 # =============================================================================
 # T065: Unit tests for list_worktrees()
 # =============================================================================
@@ -27,7 +30,7 @@ class TestListWorktrees:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
 
             worktrees = service.list_worktrees()
             assert worktrees == []
@@ -45,7 +48,7 @@ class TestListWorktrees:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service._parse_worktree_list = WorktreeService._parse_worktree_list.__get__(
                 service, WorktreeService
             )
@@ -68,7 +71,7 @@ class TestListWorktrees:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service._parse_worktree_list = WorktreeService._parse_worktree_list.__get__(
                 service, WorktreeService
             )
@@ -90,7 +93,7 @@ class TestListWorktrees:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service._parse_worktree_list = WorktreeService._parse_worktree_list.__get__(
                 service, WorktreeService
             )
@@ -128,7 +131,7 @@ class TestGetWorktree:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service.list_worktrees = mock_list
 
             worktree = service.get_worktree(123)
@@ -144,7 +147,7 @@ class TestGetWorktree:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service.list_worktrees = mock_list
 
             worktree = service.get_worktree(999)
@@ -187,7 +190,7 @@ class TestGetWorktree:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service.list_worktrees = mock_list
 
             worktree = service.get_worktree(200)
@@ -214,7 +217,7 @@ class TestGetBranch:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service._parse_branch_info = WorktreeService._parse_branch_info.__get__(
                 service, WorktreeService
             )
@@ -237,7 +240,7 @@ class TestGetBranch:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service._parse_branch_info = WorktreeService._parse_branch_info.__get__(
                 service, WorktreeService
             )
@@ -261,7 +264,7 @@ class TestGetBranch:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service._parse_branch_info = WorktreeService._parse_branch_info.__get__(
                 service, WorktreeService
             )
@@ -279,7 +282,7 @@ class TestGetBranch:
 
             service = WorktreeService.__new__(WorktreeService)
             service.repo_path = Path("/path/to/main")
-            service.git = MagicMock()
+            service.git = MagicMock(spec=GitClient)
             service._parse_branch_info = WorktreeService._parse_branch_info.__get__(
                 service, WorktreeService
             )
@@ -296,14 +299,14 @@ class TestGetBranch:
 
         service = WorktreeService.__new__(WorktreeService)
         service.repo_path = Path("/path/to/main")
-        service.git = MagicMock()
+        service.git = MagicMock(spec=GitClient)
 
         # Mock _run_git_command for branch -vv
         with patch.object(WorktreeService, "_run_git_command") as mock_run:
             mock_run.return_value = "  123-feature abc1234 Latest commit\n"
 
             # Mock git.run_command for --merged check
-            merged_result = MagicMock()
+            merged_result = MagicMock(spec=subprocess.CompletedProcess)
             merged_result.stdout = "  123-feature\n"
             service.git.run_command.return_value = merged_result
 